@@ -2,16 +2,86 @@
 # Script to populate the index for the DITA docset for Dash
 # Paul Mazaitis, https://github.com/pmazaitis
 #
-# Intended to be run in the same directory as the docset under development; 
-# paths may be fragile! 
+# Intended to be run in the same directory as the docset under development;
+# paths may be fragile!
 #
-import os 
+import os
 import re
 import sqlite3
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
+
+# The DITA documentation set doesn't have any clearly delineated content
+# like a guide, but I figured the subsections of section 2 might be useful
+# for quick access, so I process them as guides.
+guide_files = ['introduction-to-dita.html',
+                'ditamarkup.html',
+                'ditaaddressing.html',
+                'behaviors.html',
+                'configuration-specialization-and-constraints.html',
+                'coding-requirements.html',
+                'technical-content-specializations.html'
+                ]
+
+
+def element_string(element):
+    # Like BeautifulSoup's .string: the text of an element whose only content
+    # is a single string, possibly nested in single-child tags; else None
+    if len(element) == 0:
+        return element.text or ''
+    if len(element) == 1 and not (element.text or '').strip() and not (element[0].tail or '').strip():
+        return element_string(element[0])
+    return None
+
+
+def read_head(path, want_title, want_h1):
+    # Parse the page incrementally and stop as soon as the <title> and/or the
+    # first <h1> of the body have been seen; bodies are never read in full.
+    title = None
+    h1_code = None
+    h1 = None
+    for event, element in etree.iterparse(path, events=('start', 'end'), html=True, recover=True):
+        tag = element.tag if isinstance(element.tag, str) else ''
+        if event == 'end' and tag == 'title' and want_title:
+            title = element_string(element)
+            want_title = False
+        elif event == 'start' and tag == 'h1' and want_h1 and h1 is None:
+            h1 = element
+        elif event == 'end' and tag == 'code' and h1 is not None and want_h1:
+            h1_code = element_string(element)
+            want_h1 = False
+        elif event == 'end' and element is h1:
+            want_h1 = False
+        if not want_title and not want_h1:
+            break
+    return title, h1_code
+
+
+def index_file(path):
+    # Returns the (name, type, path) rows of one page
+    dir_name, fname = os.path.split(path)
+    shortpath = os.path.join(*(path.split(os.path.sep)[4:]))
+    is_guide = fname in guide_files
+    is_lang_ref = re.search('langRef', dir_name) is not None
+    title, name = read_head(path, is_guide, is_lang_ref)
+
+    rows = []
+    if is_guide:
+        rows.append((title, "Guide", shortpath))
+
+    # The two primary indexable components of this docset are the sets of
+    # elements (enclosed in angle brackets) and attributes (prefixed with an
+    # at-symbol).
+    if is_lang_ref and name:
+        if re.match('@',name):
+            rows.append((name, "Attribute", shortpath))
+        elif re.match('<',name):
+            rows.append((name, "Element", shortpath))
+    return rows
+
 
 if __name__ == '__main__':
- 
+
     # Setup
     root_dir = 'DITA.docset/Contents/Resources/'
     content_dir = os.path.join(root_dir,'Documents/docs.oasis-open.org/')
@@ -23,48 +93,17 @@ if __name__ == '__main__':
     cur.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
     cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
 
-
-    # The DITA documentation set doesn't have any clearly delineated content 
-    # like a guide, but I figured the subsections of section 2 might be useful
-    # for quick access, so I process them as guides.
-    guide_files = ['introduction-to-dita.html',
-                    'ditamarkup.html',
-                    'ditaaddressing.html',
-                    'behaviors.html',
-                    'configuration-specialization-and-constraints.html',
-                    'coding-requirements.html',
-                    'technical-content-specializations.html'
-                    ]
-
-    # The two primary indexable components of this docset are the sets of
-    # elements (enclosed in angle brackets) and attributes (prefixed with an
-    # at-symbol).
+    # Only guide pages and langRef pages are ever indexed, so everything else
+    # is skipped by path without being opened.
+    paths = []
     for dir_name, subdir_list, file_list in os.walk(content_dir):
         for fname in file_list:
-            path = os.path.join(dir_name,fname)
-            shortpath = os.path.join(*(path.split(os.path.sep)[4:]))
-            if re.search('.html$', path):
-                page = open(path).read()
-                soup = BeautifulSoup(page, "lxml")
-            
-                if fname in guide_files:
-                    rawname = soup.title
-                    name = rawname.string
-                    cur.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (name, "Guide", shortpath))    
-                    print('Found %s: %s' % ("Guide", name))
-            
-                if re.search('langRef', dir_name):
-                    rawname = soup.body.h1.code
-                    itemtype = None
-                    if rawname:
-                        name = rawname.string
-                        if re.match('@',name):
-                            itemtype = "Attribute"
-                        elif re.match('<',name):
-                            itemtype = "Element"
-        
-                    if itemtype:
-                        cur.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (name, itemtype, shortpath))    
-                        print('Found %s: %s' % (itemtype, name))
-                conn.commit()    
-            
+            if re.search('.html$', fname) and (fname in guide_files or re.search('langRef', dir_name)):
+                paths.append(os.path.join(dir_name,fname))
+
+    with ProcessPoolExecutor() as pool:
+        for rows in pool.map(index_file, paths, chunksize=32):
+            for name, itemtype, shortpath in rows:
+                print('Found %s: %s' % (itemtype, name))
+            cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
+    conn.commit()
@@ -3,9 +3,11 @@
 import os
 import sqlite3
 import shutil
+import sys
 import urllib.request
 import json
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from subprocess import call
 
 INFO_PLIST = """<!DOCTYPE plist SYSTEM "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
@@ -47,56 +49,129 @@ documents_path = os.path.join(resources_path, "Documents")
 ref_path = os.path.join(documents_path, "ref")
 
 
-DOC_ZIP = "ref-doc.zip"
-JSON_PATH = "json"
+INFO_URL = "http://d.defold.com/stable/info.json"
+CACHE_PATH = "cache"
+LAST_BUILD_FILE = os.path.join(CACHE_PATH, "last-build.sha1")
 
 
-def get_defold_sha1():
-    info_url = "http://d.defold.com/stable/info.json"
-    info_file = urllib.request.urlopen(info_url)
-    info = json.loads(info_file.read())
-    info_file.close()
-    return info["sha1"]
+def get_defold_info():
+    # sha1 and version of the current stable engine, fetched once per run
+    with urllib.request.urlopen(INFO_URL) as info_file:
+        return json.loads(info_file.read())
 
 
-def get_defold_version():
-    info_url = "http://d.defold.com/stable/info.json"
-    info_file = urllib.request.urlopen(info_url)
-    info = json.loads(info_file.read())
-    info_file.close()
-    return info["version"]
+def ref_doc_path(sha1):
+    return os.path.join(CACHE_PATH, "ref-doc-" + sha1 + ".zip")
 
 
-def get_ref_doc():
+def get_ref_doc(sha1):
+    # ref-doc.zip is cached per engine sha1 and only downloaded once
+    doc_zip = ref_doc_path(sha1)
+    if os.path.exists(doc_zip):
+        print("Using cached " + doc_zip)
+        return doc_zip
     print("Downloading ref-doc.zip")
-    sha1 = get_defold_sha1()
-    if os.path.exists(DOC_ZIP):
-        os.remove(DOC_ZIP)
-    urllib.request.urlretrieve("http://d.defold.com/archive/" + sha1 + "/engine/share/ref-doc.zip", DOC_ZIP)
+    os.makedirs(CACHE_PATH, exist_ok=True)
+    urllib.request.urlretrieve("http://d.defold.com/archive/" + sha1 + "/engine/share/ref-doc.zip", doc_zip + ".part")
+    os.replace(doc_zip + ".part", doc_zip)
+    return doc_zip
 
 
-def cleanup():
-    print("Performing cleanup")
-    if os.path.exists(JSON_PATH):
-        shutil.rmtree(JSON_PATH)
-    if os.path.exists(DOC_ZIP):
-        os.remove(DOC_ZIP)
-
+def is_up_to_date(sha1):
+    # the last build was made from this engine sha1 and its archive is still here
+    if not (os.path.exists(LAST_BUILD_FILE) and os.path.exists("Defold.tgz")):
+        return False
+    with open(LAST_BUILD_FILE, "r") as f:
+        return f.read().strip() == sha1
 
-def unzip_ref_doc():
-    print("Unpacking ref-doc.zip")
-    if os.path.exists(JSON_PATH):
-        shutil.rmtree(JSON_PATH)
 
-    with zipfile.ZipFile(DOC_ZIP) as zf:
-        zf.extractall(JSON_PATH)
+def cleanup(sha1):
+    print("Performing cleanup")
+    # keep only the artifact of the engine version that was just built
+    for file in os.listdir(CACHE_PATH):
+        if file.startswith("ref-doc-") and file != os.path.basename(ref_doc_path(sha1)):
+            os.remove(os.path.join(CACHE_PATH, file))
+    with open(LAST_BUILD_FILE, "w") as f:
+        f.write(sha1)
 
 
 def convert_hrefs(s):
     return s.replace("<a href=\"/", "<a href=\"http://www.defold.com/")
 
 
-def create_docset():
+ENTRY_TYPES = {
+    "VARIABLE": "Variable",
+    "MESSAGE": "Command",
+    "PROPERTY": "Property",
+    "MACRO": "Macro",
+    "TYPEDEF": "Type",
+    "ENUM": "Enum",
+}
+
+
+def element_doc(element, entry_type, function_name):
+    # build the html of a single element as a list of chunks
+    name = function_name
+    if entry_type == "Function":
+        name = name + "(" + ", ".join(parameter["name"] for parameter in element["parameters"]) + ")"
+
+    doc = ["<h1><a name='//apple_ref/cpp/", entry_type, "/", function_name, "' class='dashAnchor'></a><a class='entry' name='", function_name, "'>", name, "</a></h1>"]
+    doc += ["<div class='brief'>", element["brief"], "</div>"]
+    if element.get("description", "") != "":
+        doc += ["<p>", element["description"], "</p>"]
+    if element.get("note", "") != "":
+        doc += ["<p>Note: ", element["note"], "</p>"]
+    if len(element["parameters"]) > 0:
+        doc += ["<h3>PARAMETERS</h3>", "<div class='params'>"]
+        for parameter in element["parameters"]:
+            doc += ["<p class='param'>", parameter["name"], " - ", parameter["doc"], "</p>"]
+        doc.append("</div>")
+    if len(element["members"]) > 0:
+        doc += ["<h3>MEMBERS</h3>", "<div class='params'>"]
+        for member in element["members"]:
+            doc += ["<p class='param'>", member["name"], " - ", member["doc"], "</p>"]
+        doc.append("</div>")
+    if len(element["returnvalues"]) > 0:
+        doc += ["<h3>RETURN</h3>", "<div class='return'>"]
+        for returnvalue in element["returnvalues"]:
+            doc += ["<p>", returnvalue["name"], " - ", returnvalue["doc"], "</p>"]
+        doc.append("</div>")
+    if element.get("examples", "") != "":
+        doc += ["<h3>EXAMPLES</h3>", "<div class='examples'>", "<p>", element["examples"], "</p>", "</div>"]
+    doc.append("<hr/>")
+    return "".join(doc)
+
+
+def create_module_doc(doc_zip, member):
+    # runs in a worker process: writes the page of one module and returns
+    # (class_name, class_path, brief, index rows) for the parent to index.
+    # The module json is read straight from ref-doc.zip, nothing is extracted.
+    file = os.path.basename(member)
+    print("  Parsing " + file)
+    class_name = file.replace("_doc.json", "")
+    class_path = class_name + ".html"
+    with zipfile.ZipFile(doc_zip) as zf:
+        parsed_json = json.loads(zf.read(member))
+    info = parsed_json["info"]
+
+    rows = []
+    # each element is written out as soon as it is rendered
+    with open(os.path.join(ref_path, class_path), "w") as out:
+        out.write("<html><head><link rel='stylesheet' type='text/css' href='../defold.css'></head><body>")
+        out.write(convert_hrefs("<h1>" + info["name"] + "</h1>\n" + "<p>" + info["description"] + "</p>\n"))
+        for element in parsed_json["elements"]:
+            function_name = element["name"].split("\n")[0]
+            if function_name != "":
+                entry_type = ENTRY_TYPES.get(element["type"], "Function")
+                out.write(convert_hrefs(element_doc(element, entry_type, function_name)))
+                rows.append((function_name, entry_type, "ref/" + class_path + "#" + function_name))
+        out.write("</body></html>")
+
+    rows.append((class_name, 'Module', "ref/" + class_path))
+    return class_name, class_path, info["brief"], rows
+
+
+def create_docset(doc_zip):
     print("Creating docset")
     # remove old docset
     if os.path.exists(docset_path):
@@ -127,97 +202,26 @@ def create_docset():
         # create db table
         cursor.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
         # make sure duplicates are ignored
-        # cursor.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
-
-        index_html = ""
-        for root, dir, files in os.walk(JSON_PATH):
-            for file in files:
-                with open(os.path.join(root, file), "r") as fh:
-                    if file.endswith(".json"):
-                        print("  Parsing " + file)
-                        class_name = file.replace("_doc.json", "")
-                        class_path = class_name + ".html"
-                        class_doc = ""
-                        parsed_json = json.load(fh)
-                        info = parsed_json["info"]
-                        class_doc = class_doc + "<h1>" + info["name"] + "</h1>\n"
-                        class_doc = class_doc + "<p>" + info["description"] + "</p>\n"
-                        index_html = index_html + "<a class='index' href='ref/" + class_path + "'>" + class_name + "</a>" + info["brief"] + "</br>"
-                        for element in parsed_json["elements"]:
-                            function_name = element["name"].split("\n")[0]
-                            if function_name != "":
-                                entry_type = "Function"
-                                if element["type"] == "VARIABLE":
-                                    entry_type = "Variable"
-                                elif element["type"] == "MESSAGE":
-                                    entry_type = "Command"
-                                elif element["type"] == "PROPERTY":
-                                    entry_type = "Property"
-                                elif element["type"] == "MACRO":
-                                    entry_type = "Macro"
-                                elif element["type"] == "TYPEDEF":
-                                    entry_type = "Type"
-                                elif element["type"] == "ENUM":
-                                    entry_type = "Enum"
-
-                                function_path = class_path + "#" + function_name
-                                name = function_name
-                                if entry_type == "Function":
-                                    name = name + "("
-                                    for num, parameter in enumerate(element["parameters"]):
-                                        name = name + parameter["name"]
-                                        if num < len(element["parameters"]) - 1:
-                                            name = name + ", "
-                                    name = name + ")"
-
-                                class_doc = class_doc + "<h1><a name='//apple_ref/cpp/" + entry_type + "/" + function_name + "' class='dashAnchor'></a><a class='entry' name='" + function_name + "'>" + name + "</a></h1>"
-                                class_doc = class_doc + "<div class='brief'>" + element["brief"] + "</div>"
-                                if element.get("description", "") != "":
-                                    class_doc = class_doc + "<p>" + element["description"] + "</p>"
-                                if element.get("note", "") != "":
-                                    class_doc = class_doc + "<p>Note: " + element["note"] + "</p>"
-                                if len(element["parameters"]) > 0:
-                                    class_doc = class_doc + "<h3>PARAMETERS</h3>"
-                                    class_doc = class_doc + "<div class='params'>"
-                                    for parameter in element["parameters"]:
-                                        class_doc = class_doc + "<p class='param'>" + parameter["name"] + " - " + parameter["doc"] + "</p>"
-                                    class_doc = class_doc + "</div>"
-                                if len(element["members"]) > 0:
-                                    class_doc = class_doc + "<h3>MEMBERS</h3>"
-                                    class_doc = class_doc + "<div class='params'>"
-                                    for member in element["members"]:
-                                        class_doc = class_doc + "<p class='param'>" + member["name"] + " - " + member["doc"] + "</p>"
-                                    class_doc = class_doc + "</div>"
-                                if len(element["returnvalues"]) > 0:
-                                    class_doc = class_doc + "<h3>RETURN</h3>"
-                                    class_doc = class_doc + "<div class='return'>"
-                                    for returnvalue in element["returnvalues"]:
-                                        class_doc = class_doc + "<p>" + returnvalue["name"] + " - " + returnvalue["doc"] + "</p>"
-                                    class_doc = class_doc + "</div>"
-                                if element.get("examples", "") != "":
-                                    class_doc = class_doc + "<h3>EXAMPLES</h3>"
-                                    class_doc = class_doc + "<div class='examples'>"
-                                    class_doc = class_doc + "<p>" + element["examples"] + "</p>"
-                                    class_doc = class_doc + "</div>"
-
-                                class_doc = class_doc + "<hr/>"
-                                cursor.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (function_name, entry_type, "ref/" + function_path))
-
-                        with open(os.path.join(ref_path, class_path), "w") as out:
-                            out.write("<html><head><link rel='stylesheet' type='text/css' href='../defold.css'></head><body>")
-                            out.write(convert_hrefs(class_doc))
-                            out.write("</body></html>")
-
-                        cursor.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (class_name, 'Module', "ref/" + class_path))
+        cursor.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
+
+        with zipfile.ZipFile(doc_zip) as zf:
+            members = [name for name in zf.namelist() if name.endswith(".json")]
+
+        # modules are rendered in parallel, rows are inserted one batch per module
+        index_html = []
+        with ProcessPoolExecutor() as pool:
+            for class_name, class_path, brief, rows in pool.map(create_module_doc, [doc_zip] * len(members), members):
+                index_html.append("<a class='index' href='ref/" + class_path + "'>" + class_name + "</a>" + brief + "</br>")
+                cursor.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
 
         with open(os.path.join(documents_path, "index.html"), "w") as out:
             out.write("<html><head><link rel='stylesheet' type='text/css' href='defold.css'></head>")
             out.write("<body><p>Welcome to the documentation for <a href='http://www.defold.com'>Defold</a>, the free game engine by <a href='http://www.king.com'>King</a>.</p>")
-            out.write(index_html)
+            out.write("".join(index_html))
             out.write("</body></html>")
 
 
-def archive_docset():
+def archive_docset(version):
     print("Creating Defold.tgz")
     if os.path.exists("Defold.tgz"):
         os.remove("Defold.tgz")
@@ -227,12 +231,16 @@ def archive_docset():
 
     print("Creating docset.json")
     with open("docset.json", "w") as out:
-        out.write(DOCSET_JSON.format(get_defold_version()))
-
-
-get_ref_doc()
-unzip_ref_doc()
-create_docset()
-archive_docset()
-cleanup()
-print("Done!")
+        out.write(DOCSET_JSON.format(version))
+
+
+if __name__ == "__main__":
+    info = get_defold_info()
+    if is_up_to_date(info["sha1"]) and "--force" not in sys.argv:
+        print("Defold.tgz is already built from engine " + info["sha1"] + ", use --force to rebuild")
+        sys.exit(0)
+    doc_zip = get_ref_doc(info["sha1"])
+    create_docset(doc_zip)
+    archive_docset(info["version"])
+    cleanup(info["sha1"])
+    print("Done!")
@@ -1,2 +0,0 @@
-CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);
-CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);
@@ -1,22 +1,18 @@
 #!/bin/bash
 
 DOCSET_ID=Emacs-CL
-SQL_FILE=final.sql
 BASEDIR=$DOCSET_ID.docset
 CONDIR=$BASEDIR/Contents/
 RESDIR=$CONDIR/Resources
 DOCDIR=$RESDIR/Documents
-VENVDIR=venv
+MANUAL=www.gnu.org/software/emacs/manual/html_node/cl
+# The compiled Info manual of the same Emacs release, e.g. from an Emacs install
+CL_INFO=${CL_INFO:-/usr/share/info/cl.info.gz}
 
 # Make sure we start clean
-rm -rf $BASEDIR $SQL_FILE $VENVDIR *.tgz
+rm -rf $BASEDIR *.tgz
 mkdir -p $DOCDIR
 
-# Create a virtual env and install the appropriate packages
-${VENVBIN:-virtualenv} $VENVDIR
-source $VENVDIR/bin/activate
-pip install beautifulsoup4 git+https://github.com/hylang/hy.git
-
 # Download the HTML pages
 if [ ! -d www.gnu.org ]; then
     wget -q -H -c -r -k -p -np -nv -E -D www.gnu.org https://www.gnu.org/software/emacs/manual/html_node/cl/index.html
@@ -24,11 +20,11 @@ else
     echo ---------HTML already fetched-----------
 fi
 
-# gendash.hy extracts data from the HTML pages and print out
-# the corresponding INSERT statements.
-cp db.sql $SQL_FILE
-find . -name *.html | ./gendash.hy >> $SQL_FILE
-sqlite3 $RESDIR/docSet.dsidx < $SQL_FILE
+# Index the function and variable indices of the Info manual, typed by their
+# definition lines (Function, Macro, ...)
+python3 ../../tools/texinfo_index.py $CL_INFO $MANUAL $RESDIR/docSet.dsidx \
+    --prefix $MANUAL --definitions \
+    --index "Function Index=Function" --index "Variable Index=Variable"
 
 # Copy relevant files into the DOCSET directory
 cp Info.plist $CONDIR
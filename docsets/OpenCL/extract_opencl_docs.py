@@ -1,4 +1,5 @@
-import os, re, sqlite3, glob
+import os, re, sqlite3, glob, mmap
+from multiprocessing import Pool
 
 # Script to generate index for Dash docset. Notice that this code isn't really what you call 'production ready' but should get the job done.
 
@@ -15,18 +16,34 @@ cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
 
 docpath = 'OpenCL.docset/Contents/Resources/Documents'
 
-# will replace the file path to the opencl spec
+# will replace the file path to the opencl spec. Files are only read in full and
+# rewritten (atomically, through a temporary file) when they contain the link,
+# so running this again on a patched tree doesn't write anything
 
-def patch_pdf_link(file):
-	f = open(file, 'r')
-	filedata = f.read()
-	f.close()
-
-	newdata = filedata.replace("http://www.khronos.org/registry/cl/specs/","")
+spec_url = "http://www.khronos.org/registry/cl/specs/"
 
-	f = open(file, 'w')
+def patch_pdf_link(file):
+	f = open(file, 'rb')
+	try:
+		if os.fstat(f.fileno()).st_size == 0:
+			return False
+		m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			if m.find(spec_url) == -1:
+				return False
+			filedata = m[:]
+		finally:
+			m.close()
+	finally:
+		f.close()
+
+	newdata = filedata.replace(spec_url, "")
+
+	f = open(file + '.tmp', 'wb')
 	f.write(newdata)
 	f.close()
+	os.rename(file + '.tmp', file)
+	return True
 
 # This will parse the enum file and insert all the enums as constants
 
@@ -36,10 +53,12 @@ def parse_enum_file(file_path):
 	lines = f.readlines()
 	f.close()
 
+	rows = []
 	for line in lines:
 		enum = prog.search(line)
 		if enum != None:
-			cur.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (enum.group(0), 'Constant', 'enums.html'))
+			rows.append((enum.group(0), 'Constant', 'enums.html'))
+	cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
 
 	return
 
@@ -73,25 +92,36 @@ file_skip_list = ["abstractDataTypes", "accessQualifiers", "asyncCopyFunctions",
 				  "commonMin",
 				  "workItemFunctions"]
 
+# All skip list entries in a single alternation, so each name is scanned once
+
+file_skip_re = re.compile('|'.join(re.escape(skip_file) for skip_file in file_skip_list))
+
 # Check if file represents a function and should be added to the function list
 
 def is_file_function(name):
-	for skip_file in file_skip_list:
-		if name.find(skip_file) != -1:
-			return False;
-	return True;
+	return file_skip_re.search(name) is None
 
-# Handle all thefunctions
+# Patch all the pages in parallel
+
+files = glob.glob(os.path.join(docpath, "*.html"))
 
-for file in glob.glob(os.path.join(docpath, "*.html")):
-	patch_pdf_link(file)
+pool = Pool()
+patched = sum(pool.map(patch_pdf_link, files, 16))
+pool.close()
+pool.join()
+print 'patched %d of %d files' % (patched, len(files))
+
+# Handle all thefunctions
 
+rows = []
+for file in files:
 	path = os.path.basename(file)
 	name = os.path.splitext(path)[0]
 
 	if is_file_function(name):
-		cur.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (name, 'Function', path))
+		rows.append((name, 'Function', path))
 		print 'name: %s, path: %s' % (name, path)
+cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
 
 
 # Manually insert some functions
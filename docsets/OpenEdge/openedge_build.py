@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Builds the OpenEdge docsets for every release described by an openedge*.xml
+# feed in this directory (or only the versions given on the command line), e.g.
+#
+#   python3 openedge_build.py            # 11.5, 11.6 and 11.7
+#   python3 openedge_build.py 11.7
+#
+# Each OpenEdge<version>.docset/Contents/Resources/Documents must already hold
+# the exported documentation; versions without it are skipped. Most topic
+# pages are unchanged between releases, so parse results are cached by content
+# hash and shared across versions.
+#
+# Every file is read once: a lexical scan collects its links and strips
+# body@onload, and the file is only rewritten when its bytes actually change.
+
+import glob, hashlib, html, os, posixpath, re, sqlite3, sys, urllib.parse
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from openedge_rules import OpenEdgeRules
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+ANCHOR_RE = re.compile(rb'<a\b([^>]*)>(.*?)</a\s*>', re.IGNORECASE | re.DOTALL)
+HREF_RE = re.compile(rb'\shref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+TAG_RE = re.compile(rb'<[^>]*>')
+BODY_RE = re.compile(rb'<body\b[^>]*>', re.IGNORECASE)
+ONLOAD_RE = re.compile(rb'\s+onload\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)', re.IGNORECASE)
+
+
+def load_versions():
+    """Return the versions named by the openedge*.xml feeds, oldest first."""
+    versions = []
+    for config in glob.glob(os.path.join(HERE, 'openedge*.xml')):
+        versions.append(ElementTree.parse(config).findtext('version').strip())
+    return sorted(versions, key=lambda v: [int(part) for part in v.split('.')])
+
+
+def docs_path(version):
+    docset = 'OpenEdge%s.docset' % version.replace('.', '')
+    return docset, os.path.join(docset, 'Contents/Resources/Documents')
+
+
+def decode(value):
+    return html.unescape(value.decode('utf-8', 'replace'))
+
+
+def parse_page(data, rewrite):
+    """Return the (name, href) links of a page and its bytes without body@onload.
+
+    The rewritten bytes are None when nothing had to change.
+    """
+    links = []
+    for m in ANCHOR_RE.finditer(data):
+        href = HREF_RE.search(b' ' + m.group(1))
+        if href:
+            value = next(g for g in href.groups() if g is not None)
+            links.append((decode(TAG_RE.sub(b'', m.group(2))).strip(), decode(value).strip()))
+
+    # Remove the onload attribute from the body tag
+    # <body id="pYxQs0eniL26fH5dRGlU43A" class="ww_skin_page_body" onload="Page.OnLoad('../index.html#page/dvref/xml.html');">
+    rewritten = None
+    body = BODY_RE.search(data) if rewrite else None
+    if body:
+        tag = ONLOAD_RE.sub(b'', body.group(0))
+        if tag != body.group(0):
+            rewritten = data[:body.start()] + tag + data[body.end():]
+
+    return links, rewritten
+
+
+def write_if_changed(path, data):
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+def process_page(copies):
+    """Process the copies of one page across versions in a worker process.
+
+    `copies` is a list of (path, harvest) pairs. Each distinct content is
+    parsed once; links are only returned for pages that are harvested.
+    Returns [(path, links, cache_hit, written)].
+    """
+    parsed = {}
+    results = []
+    for path, harvest in copies:
+        with open(path, 'rb') as f:
+            data = f.read()
+        key = hashlib.sha1(data).hexdigest()
+        hit = key in parsed
+        if not hit:
+            parsed[key] = parse_page(data, path.endswith('.html'))
+        links, rewritten = parsed[key]
+
+        written = 0
+        if rewritten is not None:
+            written += write_if_changed(path, rewritten)
+
+        # Index paths are ASCII-only, so pages with other characters in
+        # their name also need an ASCII-named copy
+        new_file = path.encode('ascii', 'ignore').decode('ascii')
+        if path.endswith('.html') and new_file != path:
+            written += write_if_changed(new_file, data if rewritten is None else rewritten)
+
+        results.append((path, links if harvest else None, hit, written))
+    return results
+
+
+def collect_pages(versions):
+    """Group the files of every version by their path inside Documents/.
+
+    The top-level table of contents files are harvested for links, and every
+    HTML page is rewritten.
+    """
+    pages = OrderedDict()
+    for version in versions:
+        docpath = docs_path(version)[1]
+        for root, dirs, files in os.walk(docpath):
+            dirs.sort()
+            for name in sorted(files):
+                harvest = root == docpath
+                if harvest or name.endswith('.html'):
+                    relpath = os.path.relpath(os.path.join(root, name), docpath)
+                    pages.setdefault(relpath, []).append((os.path.join(root, name), harvest))
+    return pages
+
+
+def canonical_target(source, href):
+    """Return the (page, fragment) a link in `source` points to.
+
+    Relative links are unquoted and resolved against the source file, so
+    'a%20b.html', './a b.html' and 'dir/../a b.html' name the same page.
+    External links are left as they are.
+    """
+    parts = urllib.parse.urlsplit(href)
+    if parts.scheme or parts.netloc:
+        return href, ''
+    page = urllib.parse.unquote(parts.path)
+    if page:
+        page = posixpath.normpath(posixpath.join(posixpath.dirname(source), page))
+    else:
+        page = source
+    # Index paths are ASCII-only, see the ASCII-named copies in process_page
+    page = page.encode('ascii', 'ignore').decode('ascii')
+    fragment = urllib.parse.unquote(parts.fragment).encode('ascii', 'ignore').decode('ascii')
+    return page, fragment
+
+
+def build_index(version, rules, harvested):
+    """Write the index of one version from the (source, links) it harvested.
+
+    Every topic is linked from many pages, so links are deduplicated by
+    canonical target page and name before they reach SQLite; the first link
+    (and its fragment) wins.
+    """
+    docset, docpath = docs_path(version)
+
+    rows = []
+    seen = set()
+    dropped = 0
+    for source, links in harvested:
+        for text, href in links:
+            page, fragment = canonical_target(source, href)
+            path = page + '#' + fragment if fragment else page
+            name = text or path
+            if (name, page) in seen:
+                dropped += 1
+                continue
+            seen.add((name, page))
+            rows.append(rules.entry(name, path) + (path,))
+
+    db = sqlite3.connect(os.path.join(docset, 'Contents/Resources/docSet.dsidx'))
+    cur = db.cursor()
+    cur.execute('DROP TABLE IF EXISTS searchIndex;')
+    cur.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
+    cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
+    cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
+    db.commit()
+    db.close()
+    print('%s: %d entries, %d duplicate links dropped' % (docset, len(rows), dropped))
+
+
+def main(argv):
+    versions = []
+    for version in argv or load_versions():
+        # A feed can list a release whose documentation hasn't been exported
+        if os.path.isdir(docs_path(version)[1]):
+            versions.append(version)
+        else:
+            print('%s: skipped, %s does not exist' % (version, docs_path(version)[1]), file=sys.stderr)
+    if not versions:
+        sys.exit('no OpenEdge<version>.docset/Contents/Resources/Documents to build from')
+    # Loaded before any page is rewritten, so a broken rules file stops the build early
+    rules = {version: OpenEdgeRules(version) for version in versions}
+    pages = collect_pages(versions)
+
+    harvested = {}
+    hits = lookups = written = 0
+    with ProcessPoolExecutor() as pool:
+        for results in pool.map(process_page, pages.values(), chunksize=16):
+            for path, links, hit, changed in results:
+                lookups += 1
+                hits += hit
+                written += changed
+                if links is not None:
+                    harvested[path] = links
+
+    for version in versions:
+        docpath = docs_path(version)[1]
+        build_index(version, rules[version], [(os.path.relpath(path, docpath), harvested[path])
+                              for path in sorted(harvested) if os.path.dirname(path) == docpath])
+
+    rate = 100.0 * hits / lookups if lookups else 0.0
+    print('parse cache: %d hits / %d lookups (%.1f%%), %d files written'
+          % (hits, lookups, rate, written))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Classification rules for the OpenEdge docsets, applied as each searchIndex
+# row is created instead of as post-hoc UPDATE ... LIKE scans.
+#
+# The rules live in openedge_rules.json:
+#   typed_books  books whose entries are classified by name
+#   types        [{"type": Dash type, "like": [SQL LIKE patterns on the name]}],
+#                first match wins, unmatched entries stay "Guide"
+#   books        first path segment -> book title appended to the entry name
+#   versions     optional per-version "types" replacing the default list, and
+#                extra "books"
+
+import io, json, os, re
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'openedge_rules.json')
+
+
+def like_matcher(pattern):
+    # SQL LIKE is case-insensitive for ASCII. A plain '%suffix' pattern becomes
+    # a suffix test, anything else a regular expression.
+    pattern = pattern.lower()
+    literal = pattern[1:]
+    if pattern.startswith('%') and '%' not in literal and '_' not in literal:
+        return lambda name: name.endswith(literal)
+    regex = ''.join('.*' if c == '%' else '.' if c == '_' else re.escape(c) for c in pattern)
+    return re.compile(regex + r'\Z', re.DOTALL).match
+
+
+class OpenEdgeRules(object):
+
+    def __init__(self, version):
+        with io.open(RULES_PATH, encoding='utf-8') as f:
+            rules = json.load(f)
+        # Versions without overrides (e.g. a new release) use the defaults
+        overrides = rules['versions'].get(version, {})
+
+        self.typed_books = frozenset(rules['typed_books'])
+        self.types = [(rule['type'], [like_matcher(pattern) for pattern in rule['like']])
+                      for rule in overrides.get('types', rules['types'])]
+        self.books = dict(rules['books'])
+        self.books.update(overrides.get('books', {}))
+
+    def entry(self, name, path):
+        """Return the (name, type) a link harvested as a Guide is indexed with."""
+        book = path.split('/', 1)[0].lower() if '/' in path else None
+
+        entry_type = 'Guide'
+        if book in self.typed_books:
+            lowered = name.lower()
+            for rule_type, matchers in self.types:
+                if any(match(lowered) for match in matchers):
+                    entry_type = rule_type
+                    break
+
+        if book in self.books:
+            name = name + u' : ' + self.books[book]
+
+        return name, entry_type
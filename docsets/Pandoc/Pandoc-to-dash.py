@@ -4,12 +4,12 @@
 # built-in packages
 import sqlite3
 import os
+import sys
 import urllib
 import plistlib
 
 #----------------------------------
 # third party packages + httrack 
-import requests
 from bs4 import BeautifulSoup as bs
 
 
@@ -29,20 +29,39 @@ def get_html(docname, url, download_html=False):
   if download_html:
     os.system(cmd_command)
 
-def update_db(name, typ, path):
-  try:
-    cur.execute("SELECT rowid FROM searchIndex WHERE path = ?", (path,))
-    dbpath = cur.fetchone()
-    cur.execute("SELECT rowid FROM searchIndex WHERE name = ?", (name,))
-    dbname = cur.fetchone()
-
-    if dbpath is None and dbname is None:
-        cur.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (name, typ, path))
-        print('DB add >> name: {0} | type: {1} | path: {2}'.format(name, typ, path))
-    else:
-        print("record exists")
-  except:
-    pass
+class Entries(object):
+  """Index entries to insert, keeping the first entry seen for each name and
+  for each path. Lookups are set membership, so building the index is linear
+  in the number of links.
+
+  >>> entries = Entries()
+  >>> entries.add('Pandoc', 'Guide', 'pandoc.org/index.html')
+  True
+  >>> entries.add('Pandoc', 'Guide', 'pandoc.org/MANUAL.html')  # name taken
+  False
+  >>> entries.add('Manual', 'Guide', 'pandoc.org/index.html')   # path taken
+  False
+  >>> entries.add('Manual', 'Guide', 'pandoc.org/MANUAL.html')
+  True
+  >>> entries.rows
+  [('Pandoc', 'Guide', 'pandoc.org/index.html'), ('Manual', 'Guide', 'pandoc.org/MANUAL.html')]
+  """
+
+  def __init__(self):
+    self.names = set()
+    self.paths = set()
+    self.rows = []
+
+  def add(self, name, typ, path):
+    if path in self.paths or name in self.names:
+      return False
+    self.names.add(name)
+    self.paths.add(path)
+    self.rows.append((name, typ, path))
+    return True
+
+def update_db(cur, entries):
+  cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', entries.rows)
   
 def add_infoplist(base_page):
 
@@ -60,7 +79,14 @@ def add_infoplist(base_page):
   }
   plistlib.writePlist(plist_cfg, plist_path)
 
-def add_urls(pages):
+def mirrored_page(url):
+  # httrack saves http://host/dir/ as Documents/host/dir/index.html
+  path = url.split("//")[1]
+  if path.endswith('/'):
+    path += 'index.html'
+  return os.path.join(docset_name, 'Contents', 'Resources', 'Documents', path)
+
+def add_urls(pages, entries):
 
   # loop through index pages:
   for p in pages:
@@ -69,9 +95,9 @@ def add_urls(pages):
     page_name = pages[p].split('/')[-1]
     base_path = pages[p].split("//")[1]
 
-    # soup each index page
-    html = requests.get(pages[p]).text
-    soup = bs(html)
+    # soup each index page from the local mirror, no network needed
+    with open(mirrored_page(pages[p]), 'rb') as f:
+      soup = bs(f, 'lxml')
 
     for a in soup.findAll('a'):
       name = a.text.strip()
@@ -80,7 +106,10 @@ def add_urls(pages):
 
       if path is not None and not path.startswith("http"):
         path = base_path + path
-        update_db(name, p, path)
+        if entries.add(name, p, path):
+          print('DB add >> name: {0} | type: {1} | path: {2}'.format(name, p, path))
+        else:
+          print("record exists")
 
 def main():
   # docset settings
@@ -88,13 +117,17 @@ def main():
   docset_name = 'Pandoc.docset'
   output = docset_name + '/Contents/Resources/Documents/'
 
+  # with --index-only, re-index an existing mirror without touching the network
+  index_only = '--index-only' in sys.argv[1:]
+
   # docset directory
   if not os.path.exists(output):
       os.makedirs(output)
 
   # docset icon
   icon = 'http://kirkstrobeck.github.io/whatismarkdown.com/img/markdown.png'
-  urllib.urlretrieve(icon, docset_name + "/icon.png")
+  if not index_only:
+    urllib.urlretrieve(icon, docset_name + "/icon.png")
 
   # index pages
   base_page = 'http://pandoc.org/'
@@ -104,17 +137,20 @@ def main():
         }
 
   # download html
-  get_html(docset_name, base_page, True)
+  get_html(docset_name, base_page, not index_only)
 
   # create and connect to SQLite
   db = sqlite3.connect(docset_name + '/Contents/Resources/docSet.dsidx')
   global cur
   cur = db.cursor()
+  cur.execute('DROP TABLE IF EXISTS searchIndex;')
   cur.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
   cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
 
   # docset entries
-  add_urls(pages)
+  entries = Entries()
+  add_urls(pages, entries)
+  update_db(cur, entries)
   add_infoplist(base_page)
 
   # report num of entries
@@ -1,27 +1,42 @@
-import os, re, sqlite3
-from bs4 import BeautifulSoup, NavigableString, Tag 
+from __future__ import print_function
+
+import os, re, sqlite3, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'tools'))
+from sphinx_inventory import create_index, insert_rows, inventory_rows
 
 db = sqlite3.connect('PyGame.docset/Contents/Resources/docSet.dsidx')
 cur = db.cursor()
 
-try: cur.execute('DROP TABLE searchIndex;')
-except: pass
-cur.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
-cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
+create_index(cur)
 
 docpath = 'PyGame.docset/Contents/Resources/Documents'
+inventory = os.path.join(docpath, 'objects.inv')
+
+
+def genindex_rows():
+    # Untyped entries scraped from the general index, for docs without an
+    # objects.inv
+    from bs4 import BeautifulSoup
+
+    page = open(os.path.join(docpath,'genindex.html')).read()
+    soup = BeautifulSoup(page)
+
+    any = re.compile('.*')
+    for tag in soup.find_all('a', {'href':any}):
+        name = tag.text.strip()
+        if len(name) > 0:
+            path = tag.attrs['href'].strip()
+            if path.split('#')[0] not in ('index.html', 'biblio.html', 'bookindex.html'):
+                print('name: %s, path: %s' % (name, path))
+                yield name, 'func', path
 
-page = open(os.path.join(docpath,'genindex.html')).read()
-soup = BeautifulSoup(page)
 
-any = re.compile('.*')
-for tag in soup.find_all('a', {'href':any}):
-    name = tag.text.strip()
-    if len(name) > 0:
-        path = tag.attrs['href'].strip()
-        if path.split('#')[0] not in ('index.html', 'biblio.html', 'bookindex.html'):
-            cur.execute('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', (name, 'func', path))
-            print 'name: %s, path: %s' % (name, path)
+if os.path.exists(inventory):
+    insert_rows(cur, inventory_rows(inventory))
+else:
+    insert_rows(cur, genindex_rows())
 
 db.commit()
+print('%d entries' % cur.execute('SELECT count(*) FROM searchIndex').fetchone()[0])
 db.close()
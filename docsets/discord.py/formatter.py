@@ -1,24 +1,76 @@
+import argparse
 import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-files = []
-for root, dirnames, filenames in os.walk(os.getcwd()):
-    for filename in filenames:
-        if filename.endswith('.html'):
-            files.append((root,filename))
+# Everything between these two lines (the navbar and sidebar) is removed
+GRID_START = b"<div class=\"main-grid\">"
+MAIN_START = b"<main class=\"grid-item\" role=\"main\">"
+# Appended to every page processed, including those with nothing to remove, so
+# they can be recognised from their last bytes
+MARKER = b"<!-- formatted -->\n"
 
-for htmlFile in files:
+
+def is_formatted(path):
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < len(MARKER):
+            return False
+        f.seek(-len(MARKER), os.SEEK_END)
+        return f.read() == MARKER
+
+
+def format_page(path):
+    # Streams the page into a temp file next to it, which then replaces the
+    # page. Pages with nothing to remove go through the same rename, so they
+    # are marked too. Returns "formatted" or "marked", or None for pages an
+    # earlier run already processed.
+    if is_formatted(path):
+        return None
+
+    removed = 0
     remove = False
-    with open(htmlFile[0]+"/"+htmlFile[1], "r+") as f:
-        contents = f.readlines()
-        f.seek(0)
-        for i in contents:
-            if not remove:
-                if "<div class=\"main-grid\">" in i:
-                    remove = True
-                f.write(i)
-            else:
-                if "<main class=\"grid-item\" role=\"main\">" in i:
-                    remove = False
-                    f.write(i)
-        f.truncate()
+    i = b""
+    with open(path, "rb") as src, tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(path), delete=False) as dst:
+        try:
+            for i in src:
+                if not remove:
+                    if GRID_START in i:
+                        remove = True
+                    dst.write(i)
+                else:
+                    if MAIN_START in i:
+                        remove = False
+                        dst.write(i)
+                    else:
+                        removed += 1
+            if i and not i.endswith(b"\n"):
+                dst.write(b"\n")
+            dst.write(MARKER)
+        except BaseException:
+            os.unlink(dst.name)
+            raise
+
+    shutil.copymode(path, dst.name)
+    os.replace(dst.name, path)
+    return "formatted" if removed else "marked"
+
+
+def html_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith('.html'):
+                yield os.path.join(dirpath, filename)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove the navbar and sidebar from the discord.py docset pages.")
+    parser.add_argument("root", help="docset (or Documents) directory holding the HTML pages")
+    args = parser.parse_args()
 
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(format_page, html_files(args.root), chunksize=64))
+    print("%d pages formatted, %d with nothing to remove marked, %d already done"
+          % (results.count("formatted"), results.count("marked"), results.count(None)))
@@ -1,9 +1,16 @@
+import argparse
+import hashlib
+import html
+import json
 import os
+import re
 import sqlite3
 import shutil
 import subprocess
 import urllib.parse
-from bs4 import BeautifulSoup
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
 import cairosvg
 
 import os
@@ -18,6 +25,14 @@ SQLITE_DB_PATH = os.path.join(DOCSET_NAME, "Contents/Resources/docSet.dsidx")
 INFO_PLIST_PATH = os.path.join(DOCSET_NAME, "Contents/Info.plist")
 DOWNLOAD_DIR = "downloaded_docs"
 SOURCE_DOCS = os.path.join(DOWNLOAD_DIR, "uv")
+SEARCH_INDEX_PATH = os.path.join(DOCUMENTS_PATH, "search/search_index.json")
+DOCS_URL = "https://docs.astral.sh/uv/"
+# Kept outside the mirror so it isn't staged into Documents/
+SITEMAP_PATH = "uv.sitemap.xml"
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+BUILD_MANIFEST_PATH = "uv.manifest.json"
+
+StagedDocs = namedtuple("StagedDocs", "inventory changed removed pruned manifest")
 
 def download_docs():
     """Download fresh documentation from docs.astral.sh/uv/"""
@@ -54,7 +69,7 @@ def download_docs():
                 "--level=inf",  # infinite depth
                 "-q",           # quiet mode
                 "-P", DOWNLOAD_DIR,
-                "https://docs.astral.sh/uv/"
+                DOCS_URL
             ],
             check=True,
             capture_output=True,
@@ -72,41 +87,158 @@ def download_docs():
         print("  macOS: brew install wget")
         raise
 
+    # The sitemap isn't linked from any page, so the recursive mirror misses it.
+    # Its <lastmod> dates are recorded in the build manifest alongside the hashes,
+    # and --incremental reports pages where the two disagree.
+    try:
+        subprocess.run(["wget", "-q", "-O", SITEMAP_PATH, DOCS_URL + "sitemap.xml"],
+                       check=True, capture_output=True)
+    except subprocess.CalledProcessError:
+        print("Warning: could not download sitemap.xml, changes will be detected by content hash only")
+        if os.path.exists(SITEMAP_PATH):
+            os.remove(SITEMAP_PATH)
+
+def file_sha1(path):
+    """Return the SHA1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def sitemap_lastmods():
+    """Map Documents/-relative page paths to their <lastmod> in the mirrored sitemap."""
+    if not os.path.exists(SITEMAP_PATH):
+        return {}
+    lastmods = {}
+    for url in ElementTree.parse(SITEMAP_PATH).getroot().iter(SITEMAP_NS + "url"):
+        loc = url.findtext(SITEMAP_NS + "loc", "")
+        lastmod = url.findtext(SITEMAP_NS + "lastmod")
+        if not loc.startswith(DOCS_URL) or not lastmod:
+            continue
+        page = urllib.parse.unquote(loc[len(DOCS_URL):])
+        relpath = page + "index.html" if page == "" or page.endswith("/") else page
+        lastmods[relpath] = lastmod
+    return lastmods
+
+def load_manifest():
+    """Return the previous build's manifest, or None if there is nothing to update."""
+    if not (os.path.exists(BUILD_MANIFEST_PATH) and os.path.exists(SQLITE_DB_PATH)):
+        return None
+    with open(BUILD_MANIFEST_PATH, "r") as f:
+        return json.load(f)
+
+def save_manifest(manifest):
+    """Record the source hash, sitemap lastmod and pruning of every staged file."""
+    with open(BUILD_MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
 def setup_structure():
     if os.path.exists(DOCSET_NAME):
         shutil.rmtree(DOCSET_NAME)
     os.makedirs(DOCUMENTS_PATH)
 
-def copy_docs():
-    """Copy documentation from download directory and remove redirect pages"""
-    for item in os.listdir(SOURCE_DOCS):
-        s = os.path.join(SOURCE_DOCS, item)
-        d = os.path.join(DOCUMENTS_PATH, item)
-        if os.path.isdir(s):
-            shutil.copytree(s, d)
-        else:
-            shutil.copy2(s, d)
-    
-    # Remove redirect pages (these are HTML files that just redirect to another location)
-    # When docs are freshly downloaded with wget, these won't exist because wget follows redirects
-    # But we clean them up here in case any exist in the source
-    redirect_files = []
-    for root, dirs, files in os.walk(DOCUMENTS_PATH):
+def is_redirect_page(path):
+    """Return True if an HTML file is a redirect stub rather than a real page."""
+    with open(path, "rb") as f:
+        head = f.read(500)  # Read first 500 bytes
+    return b'<title>Redirecting...</title>' in head
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a copy where links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def replace_file(path, data):
+    """Write data to path through a temporary file and an atomic rename.
+
+    Staged files may be hardlinks into the download directory, so they must
+    never be rewritten in place.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def stage_docs(previous=None):
+    """Stage the download into Documents/ in a single pass.
+
+    Files are hardlinked rather than copied where the filesystem allows it,
+    and redirect pages are dropped during the same walk. When docs are freshly
+    downloaded with wget these won't exist because wget follows redirects, but
+    older mirrors may contain them.
+
+    With the `previous` build manifest, files whose content hash is unchanged
+    are left as they are in Documents/ (anchors included), pages whose sitemap
+    lastmod disagrees with their hash are reported, unchanged files the
+    previous build pruned are not staged again, and files that disappeared
+    from the mirror are deleted.
+
+    Returns a StagedDocs of the full inventory (paths relative to Documents/),
+    which later stages use instead of walking the tree again, the files that
+    were (re)staged and need processing, the removed files, the files left
+    pruned and the new manifest.
+    """
+    previous = previous or {}
+    lastmods = sitemap_lastmods()
+    inventory, changed, pruned, manifest = [], [], [], {}
+    lastmod_only = 0
+    for root, dirs, files in os.walk(SOURCE_DOCS):
+        rel_root = os.path.relpath(root, SOURCE_DOCS)
+        os.makedirs(os.path.join(DOCUMENTS_PATH, rel_root), exist_ok=True)
         for file in files:
-            if file.endswith(".html"):
-                abspath = os.path.join(root, file)
-                try:
-                    with open(abspath, "r") as f:
-                        content = f.read(500)  # Read first 500 chars
-                        if '<title>Redirecting...</title>' in content:
-                            redirect_files.append(abspath)
-                except Exception:
-                    pass
-    
-    for redirect_file in redirect_files:
-        relpath = os.path.relpath(redirect_file, DOCUMENTS_PATH)
-        print(f"Removing redirect page: {relpath}")
-        os.remove(redirect_file)
+            src = os.path.join(root, file)
+            relpath = os.path.normpath(os.path.join(rel_root, file))
+            if file.endswith(".html") and is_redirect_page(src):
+                print(f"Removing redirect page: {relpath}")
+                continue
+
+            # The content hash decides: MkDocs may bump lastmod on every build,
+            # and a page can change without its lastmod moving. Disagreements
+            # between the two are reported.
+            dst = os.path.join(DOCUMENTS_PATH, relpath)
+            sha1 = file_sha1(src)
+            lastmod = lastmods.get(relpath)
+            manifest[relpath] = {"sha1": sha1, "lastmod": lastmod}
+            before = previous.get(relpath)
+            if before and lastmod and before.get("lastmod"):
+                if before["sha1"] != sha1 and before["lastmod"] == lastmod:
+                    print(f"Changed without a new sitemap lastmod: {relpath}")
+                elif before["sha1"] == sha1 and before["lastmod"] != lastmod:
+                    lastmod_only += 1
+            if before and before["sha1"] == sha1:
+                if before.get("pruned"):
+                    manifest[relpath]["pruned"] = True
+                    pruned.append(relpath)
+                    continue
+                if os.path.exists(dst):
+                    inventory.append(relpath)
+                    continue
+
+            if os.path.exists(dst):
+                os.remove(dst)
+            link_or_copy(src, dst)
+            inventory.append(relpath)
+            changed.append(relpath)
+
+    if lastmod_only:
+        print(f"{lastmod_only} pages have a new sitemap lastmod but unchanged content")
+
+    removed = [relpath for relpath in previous if relpath not in manifest]
+    for relpath in removed:
+        print(f"Removing deleted file: {relpath}")
+        if os.path.exists(os.path.join(DOCUMENTS_PATH, relpath)):
+            os.remove(os.path.join(DOCUMENTS_PATH, relpath))
+    return StagedDocs(inventory, changed, removed, pruned, manifest)
+
+def restore_files(relpaths):
+    """Stage files a previous build pruned back into Documents/."""
+    for relpath in relpaths:
+        dst = os.path.join(DOCUMENTS_PATH, relpath)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        link_or_copy(os.path.join(SOURCE_DOCS, relpath), dst)
 
 def create_plist():
     plist_content = """<?xml version="1.0" encoding="UTF-8"?>
@@ -135,99 +267,302 @@ def create_plist():
     with open(INFO_PLIST_PATH, "w") as f:
         f.write(plist_content)
 
-def index_docs():
-    conn = sqlite3.connect(SQLITE_DB_PATH)
-    cur = conn.cursor()
-    cur.execute("CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);")
-    cur.execute("CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);")
+INDEX_BATCH_SIZE = 500
 
-    for root, dirs, files in os.walk(DOCUMENTS_PATH):
-        for file in files:
-            if file.endswith(".html"):
-                if file == "404.html":
-                    continue
+# Lexical patterns for the anchor-splicing engine. Pages are never parsed into
+# a DOM: headings are located by byte offset and anchors are spliced into the
+# original bytes, so everything else in the page is left exactly as wget saved it.
+TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+HEADING_RE = re.compile(rb'<(h[1-4])\b([^>]*)>(.*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+ID_ATTR_RE = re.compile(rb'\sid\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+TAG_RE = re.compile(rb'<[^>]*>')
 
-                abspath = os.path.join(root, file)
-                relpath = os.path.relpath(abspath, DOCUMENTS_PATH)
+def html_text(fragment):
+    """Return the text content of an HTML fragment, like BeautifulSoup's get_text()."""
+    return html.unescape(TAG_RE.sub(b'', fragment).decode('utf-8', 'replace'))
 
-                with open(abspath, "r") as f:
-                    soup = BeautifulSoup(f, "html.parser")
+def scan_headings(data):
+    """Yield (level, id, text, offset, anchored) for every h1-h4 with an id.
 
-                title_tag = soup.find("title")
-                title = title_tag.get_text() if title_tag else relpath
-                if title:
-                    title = title.split("|")[0].strip()
+    `offset` is the byte position just after the opening tag, where a Dash
+    anchor goes; `anchored` tells whether the heading already has one.
+    """
+    for m in HEADING_RE.finditer(data):
+        id_match = ID_ATTR_RE.search(b' ' + m.group(2))
+        if not id_match:
+            continue
+        hid = next(g for g in id_match.groups() if g is not None)
+        inner = m.group(3)
+        yield (m.group(1).lower().decode(), html_text(hid), html_text(inner).strip(),
+               m.start(3), b'dashAnchor' in inner)
 
-                # Skip redirect pages (they have "Redirecting..." as title)
-                if title == "Redirecting...":
-                    print(f"Skipping redirect page: {relpath}")
-                    continue
+def heading_entry_type(relpath, level, hid):
+    """Return the Dash type a heading is indexed as on reference pages, or None."""
+    if "reference/cli" in relpath:
+        # Commands
+        if level in ('h2', 'h3') and hid.startswith('uv'):
+            return 'Command'
+    elif "reference/settings" in relpath:
+        # Settings
+        if level == 'h3':
+            return 'Setting'
+    elif "reference/environment" in relpath:
+        # Environment Variables
+        if level == 'h3' and hid.startswith('uv_'):
+            return 'Environment'
+    return None
+
+def index_page(abspath, typed_ids=None):
+    """Inject Dash anchors into one page and return its (name, type, path) rows.
+
+    Runs in a worker process, so it only touches its own file and hands the
+    rows back to the parent, which is the single writer of the SQLite index.
+    When `typed_ids` (heading id -> Dash type) is given, the entries already
+    came from the search index and only decide which anchor each heading gets.
+    """
+    relpath = os.path.relpath(abspath, DOCUMENTS_PATH)
+
+    with open(abspath, "rb") as f:
+        data = f.read()
 
-                # Determine the appropriate entry type based on the path
-                # Reference and configuration pages are marked as 'Section'
-                # All other pages (getting-started, concepts, guides, pip, etc.) default to 'Guide'
-                entry_type = 'Guide'
-                if relpath.startswith('reference/') or relpath.startswith('configuration/'):
-                    entry_type = 'Section'
-                
-                cur.execute("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", (title, entry_type, relpath))
-
-                # Special handling for reference pages
-                if "reference/cli" in relpath:
-                    # Commands
-                    for h in soup.find_all(['h2', 'h3']):
-                        hid = h.get('id')
-                        if hid and (hid.startswith('uv') or hid == 'cli-reference'):
-                            if hid == 'cli-reference': continue
-                            name = h.get_text().strip()
-                            if not name: continue
-                            path = f"{relpath}#{hid}"
-                            cur.execute("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", (name, 'Command', path))
-                            add_dash_anchor(h, 'Command', name)
-
-                elif "reference/settings" in relpath:
-                    # Settings
-                    for h in soup.find_all(['h3']):
-                        hid = h.get('id')
-                        if hid:
-                            name = h.get_text().strip()
-                            if not name: continue
-                            path = f"{relpath}#{hid}"
-                            cur.execute("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", (name, 'Setting', path))
-                            add_dash_anchor(h, 'Setting', name)
-
-                elif "reference/environment" in relpath:
-                    # Environment Variables
-                    for h in soup.find_all(['h3']):
-                        hid = h.get('id')
-                        if hid and hid.startswith('uv_'):
-                            name = h.get_text().strip()
-                            if not name: continue
-                            path = f"{relpath}#{hid}"
-                            cur.execute("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", (name, 'Environment', path))
-                            add_dash_anchor(h, 'Environment', name)
-
-                # General sections for TOC
-                for h in soup.find_all(['h1', 'h2', 'h3', 'h4']):
-                    hid = h.get('id')
-                    if hid and not h.find('a', class_='dashAnchor'):
-                        name = h.get_text().strip()
-                        if name:
-                            add_dash_anchor(h, 'Section', name)
-
-                with open(abspath, "w") as f:
-                    f.write(str(soup))
+    title_match = TITLE_RE.search(data)
+    title = html_text(title_match.group(1)) if title_match else relpath
+    if title:
+        title = title.split("|")[0].strip()
+
+    # Determine the appropriate entry type based on the path
+    # Reference and configuration pages are marked as 'Section'
+    # All other pages (getting-started, concepts, guides, pip, etc.) default to 'Guide'
+    entry_type = 'Guide'
+    if relpath.startswith('reference/') or relpath.startswith('configuration/'):
+        entry_type = 'Section'
+
+    rows = [(title, entry_type, relpath)]
+
+    # Typed headings on reference pages get an index row and a typed anchor,
+    # every other heading with an id gets a 'Section' anchor for the TOC.
+    # Headings that already carry a dashAnchor keep it, so re-runs are no-ops.
+    chunks = []
+    last = 0
+    for level, hid, name, offset, anchored in scan_headings(data):
+        if not name:
+            continue
+        if typed_ids is not None:
+            anchor_type = typed_ids.get(hid)
+        else:
+            anchor_type = heading_entry_type(relpath, level, hid)
+        if anchor_type:
+            rows.append((name, anchor_type, f"{relpath}#{hid}"))
+        if anchored:
+            continue
+        chunks.append(data[last:offset])
+        chunks.append(dash_anchor(anchor_type or 'Section', name))
+        last = offset
+
+    if chunks:
+        chunks.append(data[last:])
+        replace_file(abspath, b''.join(chunks))
+
+    return rows
+
+def search_entry_type(relpath, hid, title):
+    """Return the Dash type of a search_index.json section, or None.
+
+    The search index carries no heading levels, so the reference-page rules
+    of heading_entry_type are expressed through the anchor ids instead:
+    nested settings (`pip_*`, `build-backend_*`) have an underscore in their id,
+    and settings group headings are plain text rather than a <code> span.
+    """
+    if "reference/cli" in relpath:
+        if hid.startswith('uv'):
+            return 'Command'
+    elif "reference/settings" in relpath:
+        if '_' not in hid and title.startswith('<code>'):
+            return 'Setting'
+    elif "reference/environment" in relpath:
+        if hid.startswith('uv_'):
+            return 'Environment'
+    return None
+
+def search_index_rows(inventory):
+    """Build the index rows from MkDocs' search/search_index.json in one load."""
+    staged = set(inventory)
+    with open(SEARCH_INDEX_PATH, "rb") as f:
+        docs = json.load(f)["docs"]
+
+    rows = []
+    for doc in docs:
+        page, _, hid = doc["location"].partition("#")
+        # Locations are directory URLs; wget saved them as <dir>/index.html
+        relpath = page + "index.html" if page == "" or page.endswith("/") else page
+        if relpath == "404.html" or relpath not in staged:
+            continue
+        name = html_text(doc["title"].encode()).strip()
+        if not name:
+            continue
+
+        if not hid:
+            entry_type = 'Guide'
+            if relpath.startswith('reference/') or relpath.startswith('configuration/'):
+                entry_type = 'Section'
+            rows.append((name, entry_type, relpath))
+            continue
+
+        entry_type = search_entry_type(relpath, hid, doc["title"])
+        if entry_type:
+            rows.append((name, entry_type, f"{relpath}#{hid}"))
+    return rows
+
+def index_docs(inventory, source="html", changed=None, removed=()):
+    """Index every page in a process pool, writing rows to SQLite in batches.
+
+    With source="search-index" the entries are read from MkDocs'
+    search_index.json instead, and pages are only opened for anchor injection.
+
+    For an incremental update, `changed` lists the restaged files: only those
+    pages are processed, and their rows and those of `removed` pages are
+    replaced in the existing index instead of recreating the table.
+    """
+    if changed is None:
+        changed = inventory
+    pages = [os.path.join(DOCUMENTS_PATH, relpath) for relpath in changed
+             if relpath.endswith(".html") and os.path.basename(relpath) != "404.html"]
+
+    conn = sqlite3.connect(SQLITE_DB_PATH)
+    cur = conn.cursor()
+    cur.execute("CREATE TABLE IF NOT EXISTS searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);")
+    cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS anchor ON searchIndex (name, type, path);")
+    cur.execute("CREATE INDEX IF NOT EXISTS path ON searchIndex (path);")
+
+    # Drop the rows of every page being reprocessed or removed, matching the
+    # page itself and its '#anchor' entries. The anchors are the range
+    # [page#, page$), since '$' follows '#', so both terms use the path index.
+    stale = [relpath for relpath in [*changed, *removed] if relpath.endswith(".html")]
+    cur.executemany("DELETE FROM searchIndex WHERE path = ? OR (path >= ? AND path < ?)",
+                    [(relpath, relpath + "#", relpath + "$") for relpath in stale])
+
+    if source == "search-index":
+        if os.path.exists(SEARCH_INDEX_PATH):
+            reindexed = {os.path.relpath(p, DOCUMENTS_PATH) for p in pages}
+            rows = [row for row in search_index_rows(inventory) if row[2].partition("#")[0] in reindexed]
+            cur.executemany("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", rows)
+            conn.commit()
+            conn.close()
+
+            typed_ids = {}
+            for name, entry_type, path in rows:
+                page, _, hid = path.partition("#")
+                if hid:
+                    typed_ids.setdefault(page, {})[hid] = entry_type
+            page_ids = [typed_ids.get(os.path.relpath(p, DOCUMENTS_PATH), {}) for p in pages]
+            with ProcessPoolExecutor() as pool:
+                for _ in pool.map(index_page, pages, page_ids, chunksize=8):
+                    pass
+            return
+        print(f"Warning: {SEARCH_INDEX_PATH} not found, indexing from HTML instead")
+
+    # Pages are parsed and rewritten in parallel; this process is the only
+    # writer and flushes rows with executemany as they stream back.
+    batch = []
+    with ProcessPoolExecutor() as pool:
+        for rows in pool.map(index_page, pages, chunksize=8):
+            batch.extend(rows)
+            if len(batch) >= INDEX_BATCH_SIZE:
+                cur.executemany("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", batch)
+                batch.clear()
+    if batch:
+        cur.executemany("INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?, ?, ?)", batch)
 
     conn.commit()
     conn.close()
 
-def add_dash_anchor(tag, type, name):
+def dash_anchor(type, name):
+    """Return the markup of a Dash anchor for an entry."""
     # <a name="//apple_ref/cpp/Entry Type/Entry Name" class="dashAnchor"></a>
     safe_name = urllib.parse.quote(name, safe='')
     anchor_name = f"//apple_ref/cpp/{type}/{safe_name}"
-    # Use BeautifulSoup to create the tag
-    anchor = BeautifulSoup(f'<a name="{anchor_name}" class="dashAnchor"></a>', "html.parser").a
-    tag.insert(0, anchor)
+    return f'<a class="dashAnchor" name="{anchor_name}"></a>'.encode()
+
+# Reference patterns for asset pruning: attributes in HTML, url() and
+# @import in stylesheets (and inline styles).
+REF_ATTR_RE = re.compile(rb'\s(?:href|src|data-src|poster)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+SRCSET_ATTR_RE = re.compile(rb'\ssrcset\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+CSS_URL_RE = re.compile(rb'url\(\s*(?:"([^"]*)"|\'([^\']*)\'|([^)\s]*))\s*\)', re.IGNORECASE)
+CSS_IMPORT_RE = re.compile(rb'@import\s+(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+
+def resolve_reference(relpath, ref):
+    """Resolve a reference found in relpath to a Documents/-relative path, or None."""
+    parts = urllib.parse.urlsplit(ref.strip())
+    if parts.scheme or parts.netloc or not parts.path:
+        return None  # external, data: URI or same-page fragment
+    target = urllib.parse.unquote(parts.path)
+    if target.endswith("/"):
+        target += "index.html"
+    target = os.path.normpath(os.path.join(os.path.dirname(relpath), target))
+    if target.startswith(".."):
+        return None
+    return target
+
+def asset_references(relpath):
+    """Return the Documents/-relative paths that an HTML or CSS file references."""
+    with open(os.path.join(DOCUMENTS_PATH, relpath), "rb") as f:
+        data = f.read()
+
+    refs = []
+    patterns = [CSS_URL_RE, CSS_IMPORT_RE]
+    if relpath.endswith(".html"):
+        patterns.append(REF_ATTR_RE)
+        for m in SRCSET_ATTR_RE.finditer(data):
+            value = next(g for g in m.groups() if g is not None)
+            refs.extend(candidate.split()[0] for candidate in value.split(b",") if candidate.strip())
+    for pattern in patterns:
+        for m in pattern.finditer(data):
+            refs.append(next(g for g in m.groups() if g is not None))
+
+    targets = set()
+    for ref in refs:
+        target = resolve_reference(relpath, html.unescape(ref.decode('utf-8', 'replace')))
+        if target:
+            targets.add(target)
+    return targets
+
+def prune_assets(inventory, dry_run=False, pruned=()):
+    """Delete (or with dry_run, only report) assets no page can reach.
+
+    Every staged HTML page is a root. References are followed through HTML
+    and CSS files; anything else (scripts, fonts, images) is a leaf. Files in
+    `pruned`, left out by a previous build, are restored once a page reaches
+    them again. Returns the inventory of files that remain.
+    """
+    staged = set(inventory)
+    pruned = set(pruned)
+    reachable = {relpath for relpath in inventory if relpath.endswith(".html")}
+    pending = list(reachable)
+    while pending:
+        for target in asset_references(pending.pop()):
+            if target in pruned and target not in reachable:
+                print(f"Restoring asset: {target}")
+                restore_files([target])
+                staged.add(target)
+                inventory = inventory + [target]
+            if target in staged and target not in reachable:
+                reachable.add(target)
+                if target.endswith((".html", ".css")):
+                    pending.append(target)
+
+    unreachable = [relpath for relpath in inventory if relpath not in reachable]
+    sizes = {relpath: os.path.getsize(os.path.join(DOCUMENTS_PATH, relpath)) for relpath in unreachable}
+    for relpath in sorted(unreachable, key=sizes.get, reverse=True):
+        print(f"{'Unreferenced' if dry_run else 'Removing'} asset: {relpath} ({sizes[relpath] / 1024:.1f} KiB)")
+        if not dry_run:
+            os.remove(os.path.join(DOCUMENTS_PATH, relpath))
+    total = sum(sizes.values())
+    print(f"{len(unreachable)} unreferenced assets, {total / 1024 / 1024:.2f} MiB"
+          f"{' could be pruned' if dry_run else ' pruned'}")
+
+    if dry_run:
+        return inventory
+    return [relpath for relpath in inventory if relpath in reachable]
 
 def apply_visual_refinements():
     css_path = os.path.join(DOCUMENTS_PATH, "stylesheets/extra.css")
@@ -266,15 +601,15 @@ def apply_visual_refinements():
             existing_content = f.read()
         
         if "/* Dash docset refinements */" not in existing_content:
-            with open(css_path, "a") as f:
-                f.write(dash_css)
+            replace_file(css_path, (existing_content + dash_css).encode())
     else:
         # Fallback: inject into HTML files if extra.css is missing
         pass
 
 def copy_icon():
     """Convert SVG logo to 200x200 PNG icon using cairosvg"""
-    icon_svg = os.path.join(DOCUMENTS_PATH, "assets/logo-letter.svg")
+    # Read from the mirror, since asset pruning may leave it out of Documents/
+    icon_svg = os.path.join(SOURCE_DOCS, "assets/logo-letter.svg")
     icon_dst = os.path.join(DOCSET_NAME, "icon.png")
     
     if os.path.exists(icon_svg):
@@ -296,18 +631,52 @@ def copy_icon():
         print(f"Warning: Icon source not found at {icon_svg}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the uv Dash docset")
+    parser.add_argument("--index-source", choices=["html", "search-index"], default="html",
+                        help="build the search index from the HTML pages or from MkDocs' search_index.json")
+    parser.add_argument("--prune-assets", choices=["report", "delete"],
+                        help="report or delete assets that no page references")
+    parser.add_argument("--incremental", action="store_true",
+                        help="update the existing docset, reprocessing only pages changed since the last build")
+    args = parser.parse_args()
+
     print("Downloading fresh documentation...")
     download_docs()
-    print("Setting up docset structure...")
-    setup_structure()
-    print("Copying documentation...")
-    copy_docs()
+    previous = load_manifest() if args.incremental else None
+    if previous is None:
+        print("Setting up docset structure...")
+        setup_structure()
+    print("Staging documentation...")
+    staged = stage_docs(previous)
+    inventory = staged.inventory
+    if previous is not None:
+        print(f"{len(staged.changed)} changed and {len(staged.removed)} removed files since the last build")
     print("Creating Info.plist...")
     create_plist()
     print("Indexing documentation and adding anchors...")
-    index_docs()
+    if previous is None:
+        index_docs(inventory, args.index_source)
+    else:
+        index_docs(inventory, args.index_source, staged.changed, staged.removed)
     print("Applying visual refinements...")
     apply_visual_refinements()
     print("Copying icon...")
     copy_icon()
+    if args.prune_assets == "delete":
+        print("Pruning unreferenced assets...")
+        inventory = prune_assets(inventory, pruned=staged.pruned)
+    elif staged.pruned:
+        # This build doesn't prune, so the docset gets every asset back
+        restore_files(staged.pruned)
+        inventory = inventory + staged.pruned
+    if args.prune_assets == "report":
+        print("Pruning unreferenced assets...")
+        inventory = prune_assets(inventory, dry_run=True)
+    # Pruned files are recorded so the next incremental build doesn't stage them again
+    remaining = set(inventory)
+    for relpath, entry in staged.manifest.items():
+        entry.pop("pruned", None)
+        if relpath not in remaining:
+            entry["pruned"] = True
+    save_manifest(staged.manifest)
     print("Done!")
@@ -6,50 +6,94 @@ from collections.abc import Generator, Mapping
 
 from doc2dash.parsers.intersphinx import InterSphinxParser
 from doc2dash.parsers.intersphinx_inventory import InventoryEntry
-from doc2dash.parsers.types import ParserEntry
+from doc2dash.parsers.types import EntryType, ParserEntry
 
 log = logging.getLogger(__name__)
 
 
 label_re = re.compile("[ _.]")
 
+# Labels that just point to a document (redundant with std:doc)
+DOC_LABEL_SUFFIXES = (".rst", ".ipynb")
+
 
 class InterSphinxFilter(InterSphinxParser):
+    """Drop the std:doc and std:label entries that duplicate objects entries.
+
+    The rules are compiled into lookup sets once per inventory and applied to
+    each entry as doc2dash creates it, so the inventory is never copied.
+    std:doc and std:label are the only roles doc2dash maps to Guide and
+    Section entries.
+    """
+
     def _inv_to_entries(
         self, inv: Mapping[str, Mapping[str, InventoryEntry]]
     ) -> Generator[ParserEntry, None, None]:
-        inv = {k: dict(v) for k, v in inv.items()}
-
-        remove = []
+        self._removed_docs = set()
+        self._removed_labels = set()
 
         # Filter out labels and docs that point to existing objects entries
-        obj_types = [typ for typ in inv.keys() if typ.startswith("py:")]
-        for type_key in obj_types:
-            for key in inv[type_key]:
+        for type_key, entries in inv.items():
+            if not type_key.startswith("py:"):
+                continue
+            for key in entries:
                 # remove doc that point to entry
-                remove.append(("std:doc", f"generated/{key}"))
+                self._removed_docs.add(f"generated/{key}")
                 # remove the 3 labels that point to entry
-                label_doc = f"/generated/{key.lower()}.rst"
-                for remove_key in [
-                    label_doc,
-                    f"{label_doc}#{key.lower()}",
-                    f"{label_doc}#{label_re.sub('-', key.lower())}",
-                ]:
-                    remove.append(("std:label", remove_key))
-
-        # Remove labels that just point to a document (redundant with std:doc)
-        for key in inv["std:label"]:
-            if key.endswith((".rst", ".ipynb")):
-                remove.append(("std:label", key))
-
-        # Filter out whats new labels (except versions sections)
-        for key in inv["std:label"]:
-            if key.startswith("/whats-new.rst#") and not key.startswith(
-                "/whats-new.rst#v"
+                lower = key.lower()
+                label_doc = f"/generated/{lower}.rst"
+                self._removed_labels.update(
+                    (label_doc, f"{label_doc}#{lower}", f"{label_doc}#{label_re.sub('-', lower)}")
+                )
+
+        yield from super()._inv_to_entries(inv)
+
+    def create_entry(
+        self, dash_type: EntryType, key: str, inv_entry: InventoryEntry
+    ) -> ParserEntry | None:
+        if dash_type is EntryType.GUIDE:
+            if key in self._removed_docs:
+                return None
+        elif dash_type is EntryType.SECTION:
+            if (
+                key in self._removed_labels
+                or key.endswith(DOC_LABEL_SUFFIXES)
+                # Filter out whats new labels (except versions sections)
+                or (key.startswith("/whats-new.rst#") and not key.startswith("/whats-new.rst#v"))
             ):
-                remove.append(("std:label", key))
+                return None
+        return super().create_entry(dash_type, key, inv_entry)
 
-        for type_key, key in remove:
-            inv[type_key].pop(key, None)
 
-        yield from super()._inv_to_entries(inv)
+def benchmark(size=100_000):
+    """Time the filter on a synthetic inventory of `size` entries, e.g.
+    `python3 parser.py` with doc2dash installed.
+
+    Each object comes with its generated doc and its three labels, like the
+    xarray API reference.
+    """
+    import time
+    from pathlib import Path
+
+    objects = size // 5
+    inv = {"py:method": {}, "py:function": {}, "std:doc": {}, "std:label": {}}
+    for i in range(objects):
+        key = f"xarray.Dataset.method_{i}"
+        inv["py:method" if i % 2 else "py:function"][key] = (f"generated/{key}.html#{key}", "-")
+        inv["std:doc"][f"generated/{key}"] = (f"generated/{key}.html", key)
+        label_doc = f"/generated/{key.lower()}.rst"
+        for label in (label_doc, f"{label_doc}#{key.lower()}", f"{label_doc}#{label_re.sub('-', key.lower())}"):
+            inv["std:label"][label] = (f"generated/{key}.html", "-")
+
+    parser = InterSphinxFilter(source=Path("."))
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        kept = sum(1 for _ in parser._inv_to_entries(inv))
+        timings.append(time.perf_counter() - start)
+    total = sum(len(entries) for entries in inv.values())
+    print(f"{total} entries, {kept} kept, best of 5: {min(timings):.3f}s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Compiles every docsets/*/docset.json, versions/<v>/ directory and .tgz.txt
+# receipt into one SQLite catalog, and answers questions about it, e.g.
+#
+#   python3 tools/catalog.py update                 # only docsets whose files changed
+#   python3 tools/catalog.py update --since master  # only docsets git says changed
+#   python3 tools/catalog.py latest uv GNU_Guile
+#   python3 tools/catalog.py has-version 2.2.1
+#   python3 tools/catalog.py cdn GNU_Guile
+#   python3 tools/catalog.py find guile
+#   python3 tools/catalog.py sql "SELECT name FROM docsets WHERE error IS NOT NULL"
+#
+# Each docset is recompiled only when the size or mtime of one of its
+# docset.json, archives or receipts changed (or, with --since, when git
+# reports a change), so updates stat the tree without reading it.
+
+import argparse, os, sqlite3, sys
+
+from docset_tree import (ROOT, docset_dirs, docset_files, files_signature, load_docset,
+                         read_receipt, specific_versions, changed_docsets)
+
+CATALOG_PATH = os.path.join(ROOT, '.catalog.sqlite')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS docsets(name TEXT PRIMARY KEY, title TEXT, version TEXT, archive TEXT,
+                                   author TEXT, author_link TEXT, signature TEXT, error TEXT);
+CREATE TABLE IF NOT EXISTS aliases(docset TEXT, alias TEXT);
+CREATE TABLE IF NOT EXISTS versions(docset TEXT, position INTEGER, version TEXT, archive TEXT);
+CREATE TABLE IF NOT EXISTS archives(docset TEXT, path TEXT, version TEXT, local INTEGER,
+                                    sha1 TEXT, date TEXT);
+CREATE INDEX IF NOT EXISTS docsets_version ON docsets(version);
+CREATE INDEX IF NOT EXISTS aliases_alias ON aliases(alias COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS aliases_docset ON aliases(docset);
+CREATE INDEX IF NOT EXISTS versions_version ON versions(version);
+CREATE INDEX IF NOT EXISTS versions_docset ON versions(docset);
+CREATE INDEX IF NOT EXISTS archives_docset ON archives(docset);
+CREATE INDEX IF NOT EXISTS archives_sha1 ON archives(sha1);
+'''
+
+
+def compile_docset(root, name, files):
+    """Return the rows of one docset: (docset, aliases, versions, archives)."""
+    base = os.path.join(root, 'docsets', name)
+    meta, error = {}, None
+    try:
+        meta = load_docset(os.path.join(base, 'docset.json'))
+    except (OSError, ValueError) as e:
+        error = str(e)
+    if not isinstance(meta, dict):
+        meta, error = {}, 'docset.json is not an object'
+
+    author = meta.get('author') if isinstance(meta.get('author'), dict) else {}
+    docset = (name, meta.get('name'), meta.get('version') and str(meta['version']), meta.get('archive'),
+              author.get('name'), author.get('link'), files_signature(files), error)
+    aliases = [(name, alias) for alias in meta.get('aliases') or [] if isinstance(alias, str)]
+    versions = [(name, position, version, archive)
+                for position, (version, archive) in enumerate(specific_versions(meta))]
+
+    # An archive is known from the .tgz itself, its receipt, or both
+    archives = {}
+    for rel, st in files:
+        if rel.endswith('.tgz'):
+            archives.setdefault(rel, [None, None])
+        elif rel.endswith('.tgz.txt'):
+            receipt = read_receipt(os.path.join(base, rel))
+            archives[rel[:-len('.txt')]] = [receipt.sha1, receipt.date]
+    paths = set(rel for rel, st in files)
+    rows = []
+    for path, (sha1, date) in sorted(archives.items()):
+        parts = path.split(os.sep)
+        version = parts[1] if len(parts) == 3 and parts[0] == 'versions' else None
+        rows.append((name, path.replace(os.sep, '/'), version, int(path in paths), sha1, date))
+    return docset, aliases, versions, rows
+
+
+def update(db, root=ROOT, since=None):
+    """Recompile the docsets that changed and drop the ones that are gone.
+
+    Returns the number of docsets recompiled.
+    """
+    cur = db.cursor()
+    cur.executescript(SCHEMA)
+    known = dict(cur.execute('SELECT name, signature FROM docsets'))
+    names = docset_dirs(root)
+    candidates = names if since is None else sorted(changed_docsets(since, root) & set(names))
+
+    stale = set(known) - set(names)
+    compiled = []
+    for name in candidates:
+        files = list(docset_files(root, name))
+        if since is None and known.get(name) == files_signature(files):
+            continue
+        stale.add(name)
+        compiled.append(compile_docset(root, name, files))
+
+    for table, column in (('docsets', 'name'), ('aliases', 'docset'),
+                          ('versions', 'docset'), ('archives', 'docset')):
+        cur.executemany('DELETE FROM %s WHERE %s = ?' % (table, column), [(name,) for name in stale])
+    cur.executemany('INSERT INTO docsets VALUES (?,?,?,?,?,?,?,?)', [c[0] for c in compiled])
+    cur.executemany('INSERT INTO aliases VALUES (?,?)', [row for c in compiled for row in c[1]])
+    cur.executemany('INSERT INTO versions VALUES (?,?,?,?)', [row for c in compiled for row in c[2]])
+    cur.executemany('INSERT INTO archives VALUES (?,?,?,?,?,?)', [row for c in compiled for row in c[3]])
+    db.commit()
+    return len(compiled)
+
+
+QUERIES = {
+    'latest': ('SELECT name, version, archive FROM docsets', 'name'),
+    # The current version of a docset is only in docsets, specific_versions in versions
+    'has-version': ('SELECT name, version, archive FROM docsets WHERE version = ?1 '
+                    'UNION SELECT docset, version, archive FROM versions WHERE version = ?1', None),
+    'cdn': ('SELECT docset, path, sha1, date FROM archives WHERE sha1 IS NOT NULL', 'docset'),
+    'find': ('SELECT name, title, version FROM docsets WHERE name LIKE ?1 OR title LIKE ?1 '
+             'OR name IN (SELECT docset FROM aliases WHERE alias LIKE ?1)', None),
+}
+
+
+def query(db, command, args):
+    sql, name_column = QUERIES[command]
+    params = []
+    if command == 'has-version':
+        params = [args[0]]
+    elif command == 'find':
+        params = ['%' + args[0] + '%']
+    elif args:
+        sql += ' AND' if 'WHERE' in sql else ' WHERE'
+        sql += ' %s IN (%s)' % (name_column, ','.join('?' * len(args)))
+        params = args
+    return db.execute(sql + ' ORDER BY 1', params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query the docset catalog.')
+    parser.add_argument('--db', default=CATALOG_PATH, help='catalog database (default: %(default)s)')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    up = commands.add_parser('update', help='recompile the docsets that changed')
+    up.add_argument('--since', metavar='GIT-REF', help='only recompile docsets changed since GIT-REF')
+    up.add_argument('--full', action='store_true', help='recompile every docset')
+    commands.add_parser('latest', help='latest version of docsets').add_argument('names', nargs='*')
+    commands.add_parser('has-version', help='docsets with a specific version').add_argument('names', nargs=1)
+    commands.add_parser('cdn', help='archives pushed to the CDN').add_argument('names', nargs='*')
+    commands.add_parser('find', help='docsets by name, title or alias').add_argument('names', nargs=1)
+    commands.add_parser('sql', help='run a query on the catalog').add_argument('names', nargs=1)
+    args = parser.parse_args()
+
+    exists = os.path.exists(args.db)
+    if args.command == 'update' and args.full and exists:
+        os.remove(args.db)
+        exists = False
+    db = sqlite3.connect(args.db)
+    if args.command == 'update' or not exists:
+        count = update(db, since=args.since if args.command == 'update' and exists else None)
+        print('%d docsets compiled' % count, file=sys.stderr)
+    if args.command == 'update':
+        return
+
+    if args.command == 'sql':
+        rows = db.execute(args.names[0]).fetchall()
+    else:
+        rows = query(db, args.command, args.names)
+    for row in rows:
+        print('\t'.join('' if value is None else str(value) for value in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Shared helpers of the repository tools: locating the docset directories,
+# reading their docset.json and .tgz.txt receipts, and finding the docsets a
+# git revision range touched.
+
+import hashlib, json, os, re, subprocess
+from collections import namedtuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOCSETS = os.path.join(ROOT, 'docsets')
+# The template contributors copy, at the top of the repository
+SAMPLE_DOCSET = 'Sample_Docset'
+
+# A .tgz.txt receipt is left in place of every archive pushed to the CDN:
+#
+#   Archive "GNU_Guile.tgz" was processed at this location, pushed to the CDN ...
+#   Date: 2024-07-12 11:49:19 +0000
+#   SHA1: 317254a75b5fc339746f9edcb8f44d63754d2ae8
+Receipt = namedtuple('Receipt', 'archive date sha1')
+RECEIPT_ARCHIVE_RE = re.compile(r'^Archive "([^"]*)"', re.MULTILINE)
+RECEIPT_DATE_RE = re.compile(r'^Date:\s*(.+?)\s*$', re.MULTILINE)
+RECEIPT_SHA1_RE = re.compile(r'^SHA1:\s*([0-9a-fA-F]{40})\s*$', re.MULTILINE)
+
+# Strings, or commas right before a closing bracket
+TRAILING_COMMA_RE = re.compile(r'"(?:\\.|[^"\\])*"|,(?=\s*[}\]])')
+
+
+def docset_dirs(root=ROOT):
+    """Return the names of the directories under docsets/, sorted."""
+    docsets = os.path.join(root, 'docsets')
+    return sorted(entry.name for entry in os.scandir(docsets) if entry.is_dir())
+
+
+def docset_path(root, name):
+    """Return the directory of a docset, Sample_Docset included."""
+    if name == SAMPLE_DOCSET:
+        return os.path.join(root, SAMPLE_DOCSET)
+    return os.path.join(root, 'docsets', name)
+
+
+def load_docset(path):
+    """Load a docset.json the way Dash reads it, trailing commas included.
+
+    Raises ValueError if the file is not JSON even then.
+    """
+    with open(path, encoding='utf-8-sig') as f:
+        text = f.read()
+    return json.loads(TRAILING_COMMA_RE.sub(lambda m: m.group(0) if m.group(0) != ',' else '', text))
+
+
+def specific_versions(meta):
+    """Return the (version, archive) of the specific_versions of a docset.json,
+    in file order, skipping _comment entries."""
+    versions = []
+    for entry in meta.get('specific_versions') or []:
+        if isinstance(entry, dict) and 'version' in entry:
+            versions.append((str(entry['version']), entry.get('archive')))
+    return versions
+
+
+def read_receipt(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    archive = RECEIPT_ARCHIVE_RE.search(text)
+    date = RECEIPT_DATE_RE.search(text)
+    sha1 = RECEIPT_SHA1_RE.search(text)
+    return Receipt(archive.group(1) if archive else None,
+                   date.group(1) if date else None,
+                   sha1.group(1).lower() if sha1 else None)
+
+
+def docset_files(root, name):
+    """Yield the (relative path, os.stat_result) of the files describing a
+    docset: docset.json, the icons, and the archives and receipts at the top
+    and under versions/<v>/. Only directories are listed, nothing is read."""
+    base = docset_path(root, name)
+    dirs = ['']
+    versions = os.path.join(base, 'versions')
+    if os.path.isdir(versions):
+        dirs.extend(os.path.join('versions', entry.name)
+                    for entry in os.scandir(versions) if entry.is_dir())
+    for rel in dirs:
+        for entry in os.scandir(os.path.join(base, rel)):
+            if entry.is_file() and (entry.name in ('docset.json', 'icon.png', 'icon@2x.png')
+                                    or entry.name.endswith(('.tgz', '.tgz.txt'))):
+                yield os.path.join(rel, entry.name), entry.stat()
+
+
+def files_signature(files):
+    """Return a digest of the (relative path, stat) pairs of docset_files,
+    which changes whenever one of the files is added, removed or modified."""
+    digest = hashlib.sha1()
+    for rel, st in sorted(files):
+        digest.update(('%s\0%d\0%d\n' % (rel, st.st_size, st.st_mtime_ns)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def changed_docsets(since, root=ROOT):
+    """Return the names of the docsets whose files differ from git ref `since`,
+    counting uncommitted and untracked files. Sample_Docset is included."""
+    diff = subprocess.run(['git', 'diff', '--name-only', since, '--', 'docsets', SAMPLE_DOCSET],
+                          cwd=root, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    untracked = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard', '--', 'docsets', SAMPLE_DOCSET],
+                               cwd=root, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    names = set()
+    for path in (diff + untracked).splitlines():
+        parts = path.split('/')
+        if len(parts) > 2 and parts[0] == 'docsets':
+            names.add(parts[1])
+        elif len(parts) > 1 and parts[0] == SAMPLE_DOCSET:
+            names.add(SAMPLE_DOCSET)
+    return names
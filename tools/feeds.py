@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Writes a Dash feed XML for every docset, e.g.
+#
+#   python3 tools/feeds.py --base-url https://cdn.example.com/docsets
+#   python3 tools/feeds.py --base-url https://cdn.example.com/docsets --since master
+#
+# Each feed gives the docset version and the URL of its archive, which is
+# <base-url>/<docset directory>/<archive>, and lists its specific_versions as
+# other-versions:
+#
+#   <entry>
+#       <version>3.0.10</version>
+#       <url>https://cdn.example.com/docsets/GNU_Guile/GNU_Guile.tgz</url>
+#       <other-versions>
+#           <version><name>2.2.1</name></version>
+#       </other-versions>
+#   </entry>
+#
+# Feeds are rendered in a process pool and only written when their content
+# changed; with --since only the docsets git reports as changed are rendered.
+
+import argparse, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from xml.sax.saxutils import escape
+
+from docset_tree import ROOT, docset_dirs, load_docset, specific_versions, changed_docsets
+
+FEEDS_PATH = os.path.join(ROOT, 'feeds')
+
+
+def render_feed(meta, url):
+    lines = ['<entry>',
+             '    <version>%s</version>' % escape(str(meta['version'])),
+             '    <url>%s</url>' % escape(url)]
+    versions = specific_versions(meta)
+    if versions:
+        lines.append('    <other-versions>')
+        for version, archive in versions:
+            lines.append('        <version><name>%s</name></version>' % escape(version))
+        lines.append('    </other-versions>')
+    lines.append('</entry>')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def write_if_changed(path, data):
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def build_feed(name, base_url, output, root=ROOT):
+    """Write the feed of one docset. Returns (name, written, error)."""
+    try:
+        meta = load_docset(os.path.join(root, 'docsets', name, 'docset.json'))
+        feed = render_feed(meta, '%s/%s/%s' % (base_url.rstrip('/'), name, meta['archive']))
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return name, False, '%s: %s' % (type(e).__name__, e)
+    return name, write_if_changed(os.path.join(output, name + '.xml'), feed), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write the Dash feed XML of every docset.')
+    parser.add_argument('--base-url', required=True, help='URL the docset directories are published under')
+    parser.add_argument('--output', default=FEEDS_PATH, help='directory of the feeds (default: %(default)s)')
+    parser.add_argument('--since', metavar='GIT-REF', help='only render docsets changed since GIT-REF')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    names = docset_dirs()
+    if args.since:
+        changed = changed_docsets(args.since)
+        gone = changed - set(names)
+        names = sorted(changed & set(names))
+    else:
+        gone = set(entry[:-len('.xml')] for entry in os.listdir(args.output)
+                   if entry.endswith('.xml')) - set(names)
+
+    # Feeds of docsets that no longer exist
+    removed = 0
+    for name in sorted(gone):
+        path = os.path.join(args.output, name + '.xml')
+        if os.path.exists(path):
+            os.remove(path)
+            removed += 1
+
+    written = failed = 0
+    with ProcessPoolExecutor() as pool:
+        for name, changed, error in pool.map(partial(build_feed, base_url=args.base_url, output=args.output),
+                                             names, chunksize=16):
+            if error:
+                print('%s: %s' % (name, error), file=sys.stderr)
+                failed += 1
+            written += changed
+    print('%d feeds rendered, %d written, %d removed, %d failed'
+          % (len(names), written, removed, failed), file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
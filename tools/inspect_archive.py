@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Checks docset archives without extracting them, e.g.
+#
+#   python3 tools/inspect_archive.py docsets/uv/uv.tgz
+#   python3 tools/inspect_archive.py docsets      # every .tgz below docsets/
+#
+# Each archive is streamed once: the member names are collected and only
+# Info.plist and docSet.dsidx are read, into memory. The checks are that
+#   - there is one X.docset directory with an Info.plist and a docSet.dsidx
+#   - the dashIndexFilePath page of Info.plist is in the archive
+#   - every path of the searchIndex is in the archive
+#   - no .DS_Store files were archived
+# Archives are inspected in a process pool.
+
+import argparse, os, plistlib, posixpath, re, sqlite3, sys, tarfile, tempfile
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+
+# Index paths can be prefixed with Dash metadata, e.g. <dash_entry_name=...>
+DASH_ENTRY_RE = re.compile(r'^(?:<dash_entry_[^>]*>)+')
+LEADING_DOT_RE = re.compile(r'^(?:\./)+')
+# Problems listed per kind before the rest are summarised
+EXAMPLES = 5
+
+
+def open_index(data):
+    """Open docSet.dsidx bytes as a SQLite database, in memory if possible."""
+    db = sqlite3.connect(':memory:')
+    if hasattr(db, 'deserialize'):
+        db.deserialize(data)
+        return db, None
+    db.close()
+    # Python < 3.11 cannot load a database from memory
+    tmp = tempfile.NamedTemporaryFile(suffix='.dsidx', delete=False)
+    with tmp:
+        tmp.write(data)
+    return sqlite3.connect(tmp.name), tmp.name
+
+
+def read_archive(path):
+    """Stream a .tgz once. Returns (member names, Info.plist bytes by
+    docset, docSet.dsidx bytes by docset)."""
+    members = set()
+    plists = {}
+    indexes = {}
+    with tarfile.open(path, mode='r|*') as tar:
+        for member in tar:
+            name = posixpath.normpath(LEADING_DOT_RE.sub('', member.name) or '.')
+            members.add(name)
+            parts = name.split('/')
+            if len(parts) < 2 or not parts[0].endswith('.docset') or not member.isfile():
+                continue
+            if parts[1:] == ['Contents', 'Info.plist']:
+                plists[parts[0]] = tar.extractfile(member).read()
+            elif parts[1:] == ['Contents', 'Resources', 'docSet.dsidx']:
+                indexes[parts[0]] = tar.extractfile(member).read()
+    return members, plists, indexes
+
+
+def index_target(path):
+    """Return the file an index path points to, or None for URLs."""
+    path = DASH_ENTRY_RE.sub('', path)
+    parts = urllib.parse.urlsplit(path)
+    if parts.scheme or parts.netloc:
+        return None
+    return parts.path
+
+
+def inspect(path):
+    """Return (archive, rows, [problem]) for one archive."""
+    try:
+        members, plists, indexes = read_archive(path)
+    except (OSError, tarfile.TarError, EOFError) as e:
+        return path, None, ['cannot read archive: %s' % e]
+
+    problems = []
+    stores = sorted(name for name in members if posixpath.basename(name) == '.DS_Store')
+    if stores:
+        problems.append('%d .DS_Store files, e.g. %s' % (len(stores), stores[0]))
+
+    docsets = sorted(set(name.split('/')[0] for name in members if name.split('/')[0].endswith('.docset')))
+    if len(docsets) != 1:
+        problems.append('expected one .docset directory, found %s' % (', '.join(docsets) or 'none'))
+        return path, None, problems
+    docset = docsets[0]
+    documents = docset + '/Contents/Resources/Documents/'
+
+    def exists(target):
+        # Index paths may or may not be percent-encoded
+        return any(posixpath.normpath(documents + candidate) in members
+                   for candidate in (target, urllib.parse.unquote(target)))
+
+    if docset not in plists:
+        problems.append('no Contents/Info.plist')
+    else:
+        try:
+            info = plistlib.loads(plists[docset])
+        except Exception as e:
+            problems.append('Info.plist cannot be parsed: %s' % e)
+        else:
+            index_page = info.get('dashIndexFilePath')
+            if index_page and not exists(index_target(index_page) or ''):
+                problems.append('dashIndexFilePath %s is not in the archive' % index_page)
+
+    rows = None
+    if docset not in indexes:
+        problems.append('no Contents/Resources/docSet.dsidx')
+    else:
+        db, tmp = open_index(indexes[docset])
+        try:
+            if db.execute("SELECT 1 FROM sqlite_master WHERE name = 'searchIndex'").fetchone() is None:
+                problems.append('docSet.dsidx has no searchIndex table')
+            else:
+                rows = 0
+                missing = {}
+                for (index_path,) in db.execute('SELECT path FROM searchIndex'):
+                    rows += 1
+                    target = index_target(index_path or '')
+                    if target is not None and not exists(target):
+                        missing.setdefault(target, index_path)
+                if rows == 0:
+                    problems.append('searchIndex is empty')
+                if missing:
+                    problems.append('%d index paths are not in the archive, e.g. %s'
+                                    % (len(missing), ', '.join(sorted(missing.values())[:EXAMPLES])))
+        except sqlite3.DatabaseError as e:
+            problems.append('docSet.dsidx cannot be read: %s' % e)
+        finally:
+            db.close()
+            if tmp:
+                os.remove(tmp)
+    return path, rows, problems
+
+
+def archives(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith('.tgz'):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check docset archives without extracting them.')
+    parser.add_argument('paths', nargs='+', help='.tgz archives, or directories to search for them')
+    args = parser.parse_args()
+
+    failed = inspected = 0
+    with ProcessPoolExecutor() as pool:
+        for path, rows, problems in pool.map(inspect, archives(args.paths)):
+            inspected += 1
+            if problems:
+                failed += 1
+                for problem in problems:
+                    print('%s: %s' % (path, problem))
+            else:
+                print('%s: OK, %d index entries' % (path, rows))
+    print('%d archives inspected, %d with problems' % (inspected, failed), file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Builds the searchIndex of a Sphinx docset from its objects.inv, e.g.
+#
+#   python3 tools/sphinx_inventory.py PyGame.docset/Contents/Resources/Documents/objects.inv \
+#       PyGame.docset/Contents/Resources/docSet.dsidx
+#
+# The inventory lists every object Sphinx documented with its domain:role and
+# URI, so entries are typed by role instead of scraping genindex.html. The
+# zlib stream is decompressed and parsed a chunk at a time and rows go
+# straight into executemany. Works with Python 2 and 3.
+
+from __future__ import print_function
+
+import re, sqlite3, sys, zlib
+
+CHUNK_SIZE = 64 * 1024
+
+# Dash types of the Sphinx domain:roles, roles not listed here are left out
+ROLE_TYPES = {
+    'py:module': 'Module',
+    'py:class': 'Class',
+    'py:exception': 'Exception',
+    'py:function': 'Function',
+    'py:method': 'Method',
+    'py:classmethod': 'Method',
+    'py:staticmethod': 'Method',
+    'py:attribute': 'Attribute',
+    'py:property': 'Property',
+    'py:data': 'Variable',
+    'c:function': 'Function',
+    'c:macro': 'Macro',
+    'c:type': 'Type',
+    'c:struct': 'Struct',
+    'c:member': 'Field',
+    'c:var': 'Variable',
+    'std:label': 'Section',
+    'std:term': 'Word',
+    'std:envvar': 'Environment',
+    'std:option': 'Option',
+    'std:cmdoption': 'Option',
+}
+
+LINE_RE = re.compile(r'(.+?)\s+(\S+)\s+(-?\d+)\s+?(\S*)\s+(.*)')
+
+
+def inventory_lines(f):
+    """Yield the decoded object lines of an open objects.inv (version 2)."""
+    header = f.readline()
+    if not header.startswith(b'# Sphinx inventory version 2'):
+        raise ValueError('unsupported inventory: %r' % header.strip())
+    # project, version and the compression notice
+    for _ in range(3):
+        f.readline()
+
+    decompressor = zlib.decompressobj()
+    pending = b''
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        data = decompressor.decompress(chunk) if chunk else decompressor.flush()
+        lines = (pending + data).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode('utf-8')
+        if not chunk:
+            break
+    if pending:
+        yield pending.decode('utf-8')
+
+
+def inventory_entries(path):
+    """Yield (name, role, uri, dispname) for every object of an objects.inv."""
+    with open(path, 'rb') as f:
+        for line in inventory_lines(f):
+            m = LINE_RE.match(line.rstrip())
+            if not m:
+                continue
+            name, role, priority, uri, dispname = m.groups()
+            if uri.endswith('$'):
+                uri = uri[:-1] + name
+            yield name, role, uri, dispname
+
+
+def inventory_rows(path, prefix=''):
+    """Yield the (name, type, path) rows of an objects.inv.
+
+    Labels are indexed by their title; labels without one (dispname "-")
+    only mark a location and are left out.
+    """
+    for name, role, uri, dispname in inventory_entries(path):
+        entry_type = ROLE_TYPES.get(role)
+        if entry_type is None:
+            continue
+        if role == 'std:label':
+            if dispname == '-':
+                continue
+            name = dispname
+        yield name, entry_type, prefix + uri
+
+
+def create_index(cur):
+    cur.execute('DROP TABLE IF EXISTS searchIndex;')
+    cur.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
+    cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
+
+
+def insert_rows(cur, rows):
+    cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
+
+
+if __name__ == '__main__':
+    db = sqlite3.connect(sys.argv[2])
+    cur = db.cursor()
+    create_index(cur)
+    insert_rows(cur, inventory_rows(sys.argv[1]))
+    db.commit()
+    print('%s: %d entries' % (sys.argv[2], cur.execute('SELECT count(*) FROM searchIndex').fetchone()[0]))
+    db.close()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Builds the searchIndex of a GNU manual docset from the indices of its
+# compiled Info file instead of scraping the *-Index.html pages, e.g.
+#
+#   python3 tools/texinfo_index.py guile.info.gz \
+#       GNU_Guile.docset/Contents/Resources/Documents/guile \
+#       GNU_Guile.docset/Contents/Resources/docSet.dsidx \
+#       --prefix guile --index "Procedure Index=Procedure" --index "Type Index=Type"
+#
+# Index nodes list every entry with the node it belongs to and its line in
+# that node. Nodes map to the file names texi2any gives the split HTML manual,
+# and each entry to the matching index-* anchor found in that file, so the
+# result does not depend on how the HTML index pages are laid out.
+#
+# The GNU_Guile, Org_Mode and Emacs-CL docsets use this module.
+
+import argparse, gzip, io, os, re, sqlite3
+from collections import defaultdict, namedtuple
+
+# Dash types of the usual Texinfo index nodes
+DASH_TYPES = {
+    'Procedure Index': 'Procedure',
+    'Function Index': 'Function',
+    'Command and Function Index': 'Function',
+    'Variable Index': 'Variable',
+    'Type Index': 'Type',
+    'Key Index': 'Command',
+    'Concept Index': 'Entry',
+}
+
+IndexEntry = namedtuple('IndexEntry', 'index name node line category')
+
+NODE_RE = re.compile(r'\bNode:\s*(?:\x7f([^\x7f]*)\x7f|([^,\t\n]*))')
+INDIRECT_RE = re.compile(r'^(.+?): \d+$', re.MULTILINE)
+INDEX_COOKIE = '\0\b[index\0\b]'
+ENTRY_RE = re.compile(r'\* (?:\x7f([^\x7f]*)\x7f|(.+?)):\s+(?:\x7f([^\x7f]*)\x7f|(.+?))\.'
+                      r'(?:\s+\(line\s+(\d+)\))?\s*$')
+DUPLICATE_RE = re.compile(r'\s+<\d+>$')
+DEFINITION_RE = re.compile(r'^ -- ([^:\n]+): (\S+)', re.MULTILINE)
+ANCHOR_RE = re.compile(r'\s(?:id|name)\s*=\s*"(index-[^"]+)"')
+
+
+def open_info(path):
+    if path.endswith('.gz'):
+        return io.TextIOWrapper(gzip.open(path), encoding='utf-8', errors='replace')
+    return io.open(path, encoding='utf-8', errors='replace')
+
+
+def read_nodes(path):
+    """Return the [(node, text)] of an Info file, following split files."""
+    with open_info(path) as f:
+        chunks = f.read().split('\x1f')
+
+    for chunk in chunks:
+        if chunk.startswith('\nIndirect:'):
+            suffix = '.gz' if path.endswith('.gz') else ''
+            chunks = []
+            for part in INDIRECT_RE.findall(chunk):
+                with open_info(os.path.join(os.path.dirname(path), part + suffix)) as f:
+                    chunks.extend(f.read().split('\x1f'))
+            break
+
+    nodes = []
+    for chunk in chunks:
+        header, _, text = chunk.lstrip('\n').partition('\n')
+        if not header.startswith('File:'):
+            continue
+        m = NODE_RE.search(header)
+        if m:
+            nodes.append((' '.join((m.group(1) or m.group(2)).split()), text))
+    return nodes
+
+
+def entry_lines(text):
+    # Long entries can be wrapped onto indented continuation lines
+    line = None
+    for raw in text.splitlines():
+        if raw.startswith('* '):
+            if line is not None:
+                yield line
+            line = raw
+        elif line is not None and raw[:1].isspace() and raw.strip():
+            line += ' ' + raw.strip()
+    if line is not None:
+        yield line
+
+
+def index_entries(nodes):
+    """Yield an IndexEntry for every entry of every index node.
+
+    The category is the definition line (" -- Macro: name ...") of the
+    entry in its node, if it has one.
+    """
+    definitions = {}
+    for node, text in nodes:
+        if INDEX_COOKIE not in text:
+            for category, name in DEFINITION_RE.findall(text):
+                definitions.setdefault((node, name), category.strip())
+
+    for index, text in nodes:
+        if INDEX_COOKIE not in text:
+            continue
+        for line in entry_lines(text.split(INDEX_COOKIE, 1)[1]):
+            m = ENTRY_RE.match(line)
+            if not m:
+                continue
+            name = DUPLICATE_RE.sub('', m.group(1) or m.group(2))
+            node = ' '.join((m.group(3) or m.group(4)).split())
+            yield IndexEntry(index, name, node, int(m.group(5) or 0),
+                             definitions.get((node, name)))
+
+
+def html_name(text):
+    """Return text as texi2any writes it in file names and ids.
+
+    >>> html_name('Argument Lists')
+    'Argument-Lists'
+    >>> html_name('cl-defun')
+    'cl_002ddefun'
+    """
+    out = []
+    for c in ' '.join(text.split()):
+        if c.isascii() and c.isalnum():
+            out.append(c)
+        elif c == ' ':
+            out.append('-')
+        elif ord(c) < 0x10000:
+            out.append('_%04x' % ord(c))
+        else:
+            out.append('__%06x' % ord(c))
+    return ''.join(out)
+
+
+def node_file(node):
+    return 'index.html' if node == 'Top' else html_name(node) + '.html'
+
+
+def anchor_queues(ids):
+    """Group the index-* anchor ids of a page by the entry name they belong
+    to, in page order. Texinfo suffixes the ids of repeated names with -<n>;
+    an id ending in -<n> only counts as a repeat when the unsuffixed id is on
+    the page too, since a name like "foo 1" gives index-foo-1 as well.
+
+    >>> queues = anchor_queues(['index-foo', 'index-bar-1', 'index-foo-1', 'index-foo-2'])
+    >>> queues['index-foo']
+    ['index-foo', 'index-foo-1', 'index-foo-2']
+    >>> queues['index-bar-1']
+    ['index-bar-1']
+    """
+    present = set(ids)
+    by_name = defaultdict(list)
+    for anchor in ids:
+        base = re.sub(r'-\d+$', '', anchor)
+        by_name[base if base != anchor and base in present else anchor].append(anchor)
+    return dict(by_name)
+
+
+class AnchorResolver(object):
+    """Map index entries to the index-* anchors of the HTML manual.
+
+    Every page is scanned once. Repeated entries get "-<n>" suffixed ids,
+    which are handed out in page order; callers resolve entries sorted by
+    node and line so they line up.
+    """
+
+    def __init__(self, doc_dir):
+        self.doc_dir = doc_dir
+        self.pages = {}
+
+    def anchors(self, page):
+        if page not in self.pages:
+            try:
+                with io.open(os.path.join(self.doc_dir, page), encoding='utf-8', errors='replace') as f:
+                    ids = ANCHOR_RE.findall(f.read())
+            except (IOError, OSError):
+                self.pages[page] = None
+                return None
+            self.pages[page] = {key: iter(value) for key, value in anchor_queues(ids).items()}
+        return self.pages[page]
+
+    def resolve(self, entry):
+        """Return page#anchor for the entry, the page alone if it has no
+        matching anchor left, or None if the page does not exist."""
+        page = node_file(entry.node)
+        anchors = self.anchors(page)
+        if anchors is None:
+            return None
+        anchor = next(anchors.get('index-' + html_name(entry.name), iter(())), None)
+        return page + '#' + anchor if anchor else page
+
+
+def by_index(types, definitions=False):
+    """Return a classifier typing the entries of the index nodes in types.
+
+    With definitions, entries with a definition line take its category
+    (Function, Macro, ...) as their type instead.
+    """
+    def classify(entry):
+        if entry.index not in types:
+            return None
+        if definitions and entry.category:
+            return entry.name, entry.category
+        return entry.name, types[entry.index]
+    return classify
+
+
+def index_rows(info_path, doc_dir, classify, prefix='', first_only=False):
+    """Return the (name, type, path) rows of a manual and the number of
+    entries whose page is missing from doc_dir.
+
+    classify(entry) returns the (name, type) to index an entry with, or None
+    to leave it out. With first_only, only the first entry of a name in each
+    index is kept.
+    """
+    entries = list(index_entries(read_nodes(info_path)))
+
+    # Every entry takes its anchor, in page order, even if it is left out
+    resolver = AnchorResolver(doc_dir)
+    paths = [None] * len(entries)
+    for i in sorted(range(len(entries)), key=lambda i: (entries[i].node, entries[i].line)):
+        paths[i] = resolver.resolve(entries[i])
+
+    rows = []
+    seen = set()
+    missing = 0
+    for entry, path in zip(entries, paths):
+        indexed = classify(entry)
+        if indexed is None:
+            continue
+        if first_only:
+            if (entry.index, entry.name) in seen:
+                continue
+            seen.add((entry.index, entry.name))
+        if path is None:
+            missing += 1
+            continue
+        rows.append(indexed + (prefix + '/' + path if prefix else path,))
+    return rows, missing
+
+
+def load_index(db_path, rows):
+    db = sqlite3.connect(db_path)
+    cur = db.cursor()
+    cur.execute('DROP TABLE IF EXISTS searchIndex;')
+    cur.execute('CREATE TABLE searchIndex(id INTEGER PRIMARY KEY, name TEXT, type TEXT, path TEXT);')
+    cur.execute('CREATE UNIQUE INDEX anchor ON searchIndex (name, type, path);')
+    cur.executemany('INSERT OR IGNORE INTO searchIndex(name, type, path) VALUES (?,?,?)', rows)
+    db.commit()
+    db.close()
+
+
+def build(info_path, doc_dir, db_path, classify, prefix='', first_only=False):
+    rows, missing = index_rows(info_path, doc_dir, classify, prefix, first_only)
+    load_index(db_path, rows)
+    print('%s: %d entries, %d entries without an HTML page' % (db_path, len(rows), missing))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index a GNU manual docset from its Info file.')
+    parser.add_argument('info', help='Info file of the manual (may be gzipped or split)')
+    parser.add_argument('docs', help='directory holding the split HTML manual')
+    parser.add_argument('db', help='docSet.dsidx to (re)create')
+    parser.add_argument('--prefix', default='', help='path of the docs directory inside Documents')
+    parser.add_argument('--index', action='append', metavar='NODE=TYPE',
+                        help='index node and its Dash type (default: %s)'
+                        % ', '.join('%s=%s' % item for item in sorted(DASH_TYPES.items())))
+    parser.add_argument('--definitions', action='store_true',
+                        help='type entries by their definition category (Function, Macro, ...)')
+    parser.add_argument('--first-only', action='store_true',
+                        help='keep only the first entry of a name in each index')
+    args = parser.parse_args()
+
+    types = dict(item.split('=', 1) for item in args.index) if args.index else dict(DASH_TYPES)
+    build(args.info, args.docs, args.db, by_index(types, args.definitions), args.prefix, args.first_only)
+
+
+if __name__ == '__main__':
+    main()
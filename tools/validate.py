@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Checks the docset directories against the contribution rules of the README,
+# e.g.
+#
+#   python3 tools/validate.py                  # every docset and Sample_Docset
+#   python3 tools/validate.py uv GNU_Guile
+#   python3 tools/validate.py --since master   # docsets changed since master
+#
+# Errors break the contribution rules: docset.json that is not strict JSON or
+# lacks name, version or archive, an archive not named after the docset name
+# (with whitespace replaced by underscores), icons that are not 16x16 and 32x32
+# PNGs, specific_versions archives missing from versions/<v>/, and versions
+# that are not listed newest first. With --allow-trailing-commas, trailing
+# commas Dash tolerates are only a warning. Names and archives that don't match
+# the directory and unknown keys are warnings, which --strict turns into errors.
+#
+# Sample_Docset is a template: it is not named after its directory and its
+# specific_versions archives are placeholders, so those checks are skipped.
+#
+# Results are cached in .validate-cache.json by the size and mtime of the files
+# each check reads, so only docsets that changed are validated again.
+
+import argparse, json, os, re, struct, sys
+from concurrent.futures import ProcessPoolExecutor
+
+from docset_tree import (ROOT, SAMPLE_DOCSET, docset_dirs, docset_path, docset_files, files_signature,
+                         load_docset, specific_versions, changed_docsets)
+
+CACHE_PATH = os.path.join(ROOT, '.validate-cache.json')
+# Bump when the checks change, so cached results are not reused
+CACHE_VERSION = 3
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+ICON_SIZES = (('icon.png', 16), ('icon@2x.png', 32))
+KNOWN_KEYS = frozenset(['name', 'version', 'archive', 'author', 'aliases', 'specific_versions',
+                        'package', 'title', 'major_versioned'])
+VERSION_RE = re.compile(r'v?(\d+(?:\.\d+)*)')
+
+
+def version_key(version):
+    """Return the leading numeric components of a version, or None.
+
+    >>> version_key('2.87.0/1688715345') > version_key('2.9')
+    True
+    >>> version_key('FAQ') is None
+    True
+    """
+    m = VERSION_RE.match(version)
+    return tuple(int(part) for part in m.group(1).split('.')) if m else None
+
+
+def icon_size(path):
+    # The width and height are the first fields of the IHDR chunk
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or not header.startswith(PNG_SIGNATURE) or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def validate_docset(root, name, allow_trailing_commas=False):
+    """Return the [(level, message)] problems of one docset directory."""
+    base = docset_path(root, name)
+    problems = []
+
+    path = os.path.join(base, 'docset.json')
+    try:
+        with open(path, encoding='utf-8-sig') as f:
+            json.load(f)
+    except ValueError as e:
+        # Only trailing commas make it past load_docset below
+        problems.append(('warning' if allow_trailing_commas else 'error',
+                         'docset.json is not strict JSON (%s)' % e))
+    except OSError as e:
+        return [('error', 'cannot read docset.json (%s)' % e.strerror)]
+    try:
+        meta = load_docset(path)
+    except ValueError as e:
+        return [('error', 'docset.json is not valid JSON (%s)' % e)]
+    if not isinstance(meta, dict):
+        return [('error', 'docset.json is not an object')]
+
+    for key in ('name', 'version', 'archive'):
+        if not meta.get(key):
+            problems.append(('error', 'docset.json has no %s' % key))
+    for key in sorted(set(meta) - KNOWN_KEYS):
+        problems.append(('warning', 'unknown key "%s"' % key))
+
+    template = name == SAMPLE_DOCSET
+    archive = meta.get('archive')
+    if archive and meta.get('name'):
+        expected = str(meta['name']).replace(' ', '_') + '.tgz'
+        if archive != expected:
+            problems.append(('error', 'archive "%s" is not named after the docset name (%s)' % (archive, expected)))
+    if archive and archive != name + '.tgz' and not template:
+        problems.append(('warning', 'archive "%s" is not named after the directory (%s.tgz)' % (archive, name)))
+    if meta.get('name') and str(meta['name']).replace(' ', '_') != name and not template:
+        problems.append(('warning', 'name "%s" does not match the directory' % meta['name']))
+
+    for icon, size in ICON_SIZES:
+        icon_path = os.path.join(base, icon)
+        if os.path.exists(icon_path):
+            actual = icon_size(icon_path)
+            if actual is None:
+                problems.append(('error', '%s is not a PNG' % icon))
+            elif actual != (size, size):
+                problems.append(('error', '%s is %dx%d, not %dx%d' % ((icon,) + actual + (size, size))))
+
+    versions = specific_versions(meta)
+    for version, version_archive in versions:
+        if not version_archive:
+            problems.append(('error', 'version %s has no archive' % version))
+        elif not version_archive.startswith('versions/'):
+            problems.append(('error', 'version %s archive "%s" is not under versions/' % (version, version_archive)))
+        elif template:
+            continue
+        elif not os.path.isdir(os.path.join(base, os.path.dirname(version_archive))):
+            problems.append(('error', 'version %s: %s/ does not exist' % (version, os.path.dirname(version_archive))))
+        elif not (os.path.exists(os.path.join(base, version_archive))
+                  or os.path.exists(os.path.join(base, version_archive + '.txt'))):
+            problems.append(('error', 'version %s: neither %s nor its .txt receipt exist' % (version, version_archive)))
+
+    # Versions without a numeric prefix (e.g. "FAQ") cannot be ordered
+    for newer, older in zip(versions, versions[1:]):
+        newer_key, older_key = version_key(newer[0]), version_key(older[0])
+        if newer_key is not None and older_key is not None and newer_key < older_key:
+            problems.append(('error', 'specific_versions are not newest first (%s before %s)'
+                             % (newer[0], older[0])))
+    return problems
+
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache['docsets'] if cache.get('version') == CACHE_VERSION else {}
+
+
+def save_cache(path, docsets):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'version': CACHE_VERSION, 'docsets': docsets}, f, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def validate(names, root=ROOT, cache_path=CACHE_PATH, allow_trailing_commas=False):
+    """Return {name: [(level, message)]} for the given docsets, validating
+    in a process pool only those not found in the cache."""
+    cache = load_cache(cache_path) if cache_path else {}
+    signatures = {name: files_signature(docset_files(root, name)) for name in names}
+
+    results = {}
+    pending = []
+    for name in names:
+        cached = cache.get(name)
+        if (cached and cached['signature'] == signatures[name]
+                and cached['allow_trailing_commas'] == allow_trailing_commas):
+            results[name] = [tuple(problem) for problem in cached['problems']]
+        else:
+            pending.append(name)
+
+    if pending:
+        with ProcessPoolExecutor() as pool:
+            for name, problems in zip(pending, pool.map(validate_docset, [root] * len(pending), pending,
+                                                        [allow_trailing_commas] * len(pending), chunksize=16)):
+                results[name] = problems
+                cache[name] = {'signature': signatures[name], 'allow_trailing_commas': allow_trailing_commas,
+                               'problems': problems}
+        if cache_path:
+            save_cache(cache_path, cache)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check docset directories against the contribution rules.')
+    parser.add_argument('names', nargs='*', help='docset directories to check (default: all, and %s)' % SAMPLE_DOCSET)
+    parser.add_argument('--since', metavar='GIT-REF', help='only check docsets changed since GIT-REF')
+    parser.add_argument('--strict', action='store_true', help='treat warnings as errors')
+    parser.add_argument('--allow-trailing-commas', action='store_true',
+                        help='only warn about trailing commas in docset.json, which Dash tolerates')
+    parser.add_argument('--no-cache', action='store_true', help='ignore and do not update the cache')
+    args = parser.parse_args()
+
+    existing = docset_dirs() + [SAMPLE_DOCSET]
+    names = args.names or existing
+    unknown = sorted(set(names) - set(existing))
+    if unknown:
+        parser.error('no such docsets: %s' % ', '.join(unknown))
+    if args.since:
+        names = sorted(set(names) & changed_docsets(args.since))
+
+    results = validate(names, cache_path=None if args.no_cache else CACHE_PATH,
+                       allow_trailing_commas=args.allow_trailing_commas)
+    failed = 0
+    for name in names:
+        levels = set()
+        for level, message in results[name]:
+            print('%s: %s: %s' % (name, level, message))
+            levels.add(level)
+        failed += 'error' in levels or (args.strict and 'warning' in levels)
+    print('%d docsets checked, %d failed' % (len(names), failed), file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Checks docset archives against the SHA1 of their .tgz.txt receipts, e.g.
+#
+#   python3 tools/verify_archives.py                              # archives inside docsets/
+#   python3 tools/verify_archives.py uv GNU_Guile
+#   python3 tools/verify_archives.py --mirror /mnt/cdn-mirror     # <mirror>/<docset>/[versions/<v>/]<archive>
+#
+# Archives are hashed in a thread pool with large buffered reads (hashlib
+# releases the GIL while hashing them), so verification is bound by I/O. The
+# digests are cached in .verify-cache.json by path, size and mtime, so only
+# new or modified archives are hashed again.
+
+import argparse, hashlib, json, os, sys
+from concurrent.futures import ThreadPoolExecutor
+
+from docset_tree import ROOT, DOCSETS, docset_dirs, docset_files, read_receipt
+
+CACHE_PATH = os.path.join(ROOT, '.verify-cache.json')
+BUFFER_SIZE = 1 << 20
+
+
+def file_sha1(path):
+    digest = hashlib.sha1()
+    buf = bytearray(BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def receipts(names, root=ROOT):
+    """Yield (docset, archive path relative to the docset, Receipt)."""
+    for name in names:
+        for rel, st in docset_files(root, name):
+            if rel.endswith('.tgz.txt'):
+                yield name, rel[:-len('.txt')], read_receipt(os.path.join(root, 'docsets', name, rel))
+
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(cache, f, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def verify(mirror, names, cache_path=CACHE_PATH, workers=None):
+    """Compare the archives under mirror with their receipts.
+
+    Returns (verified, mismatches, missing, unverified, unreadable) where
+    mismatches is [(docset, archive, expected, actual)], missing
+    [(docset, archive)] for receipts without a local archive, unverified
+    [(docset, archive)] for archives whose .tgz.txt holds no SHA1 (some are
+    just download links, not receipts) and unreadable
+    [(docset, archive, reason)] for archives that cannot be read.
+    """
+    cache = load_cache(cache_path) if cache_path else {}
+    checks = []
+    missing = []
+    unverified = []
+    unreadable = []
+    for name, rel, receipt in receipts(names):
+        path = os.path.join(mirror, name, rel)
+        if not os.path.isfile(path):
+            missing.append((name, rel))
+        elif receipt.sha1 is None:
+            unverified.append((name, rel))
+        else:
+            checks.append((name, rel, receipt.sha1, os.path.abspath(path)))
+
+    def digest(check):
+        path = check[3]
+        try:
+            st = os.stat(path)
+            cached = cache.get(path)
+            if cached and cached[:2] == [st.st_size, st.st_mtime_ns]:
+                return cached[2], None
+            sha1 = file_sha1(path)
+        except OSError as e:
+            return None, e.strerror
+        cache[path] = [st.st_size, st.st_mtime_ns, sha1]
+        return sha1, None
+
+    mismatches = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (name, rel, expected, path), (actual, error) in zip(checks, pool.map(digest, checks)):
+            if error:
+                unreadable.append((name, rel, error))
+            elif actual != expected:
+                mismatches.append((name, rel, expected, actual))
+    if cache_path:
+        save_cache(cache_path, cache)
+    return len(checks), mismatches, missing, unverified, unreadable
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check docset archives against their .tgz.txt receipts.')
+    parser.add_argument('names', nargs='*', help='docsets to check (default: all)')
+    parser.add_argument('--mirror', default=DOCSETS,
+                        help='directory holding <docset>/[versions/<v>/]<archive> (default: %(default)s)')
+    parser.add_argument('--workers', type=int, help='hashing threads (default: Python\'s choice)')
+    parser.add_argument('--show-missing', action='store_true', help='list receipts without a local archive')
+    parser.add_argument('--no-cache', action='store_true', help='ignore and do not update the cache')
+    args = parser.parse_args()
+    if not os.path.isdir(args.mirror):
+        parser.error('%s is not a directory' % args.mirror)
+    unknown = sorted(set(args.names) - set(docset_dirs()))
+    if unknown:
+        parser.error('no such docsets: %s' % ', '.join(unknown))
+
+    verified, mismatches, missing, unverified, unreadable = verify(
+        args.mirror, args.names or docset_dirs(), None if args.no_cache else CACHE_PATH, args.workers)
+    for name, rel, expected, actual in mismatches:
+        print('%s/%s: MISMATCH receipt %s, archive %s' % (name, rel, expected, actual))
+    for name, rel, reason in unreadable:
+        print('%s/%s: ERROR %s' % (name, rel, reason))
+    # Not a failure: there is nothing to compare these archives with
+    for name, rel in unverified:
+        print('%s/%s: not verified, its .tgz.txt has no SHA1' % (name, rel))
+    if args.show_missing:
+        for name, rel in missing:
+            print('%s/%s: missing' % (name, rel))
+    print('%d archives verified, %d mismatched, %d unreadable, %d without a SHA1, %d without a local archive'
+          % (verified, len(mismatches), len(unreadable), len(unverified), len(missing)), file=sys.stderr)
+    sys.exit(1 if mismatches or unreadable else 0)
+
+
+if __name__ == '__main__':
+    main()